@@ -1,10 +1,17 @@
 import requests
+from requests.adapters import HTTPAdapter
 import xml.etree.ElementTree as ET
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+import io
 import json
 import sys
 import subprocess
 import os
 import urllib3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from InquirerPy import inquirer
 
 # Suppress SSL warnings
@@ -33,6 +40,12 @@ SNOWFLAKE_ROLE = cfg.get("snowflake.archive.role", "")
 SNOWFLAKE_USERNAME = cfg.get("snowflake.archive.username", "")
 SNOWFLAKE_PASSWORD = cfg.get("snowflake.archive.password", "")
 
+# Shared keep-alive session for all XMLA calls (safe to use from the discovery threads)
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+SESSION.auth = (USERNAME, PASSWORD)
+SESSION.verify = False
+SESSION.headers.update({"Content-Type": "text/xml"})
 
 # SOAP Templates
 CATALOG_QUERY = """<?xml version="1.0" encoding="utf-8"?>
@@ -153,8 +166,15 @@ def get_proxy_java_properties():
 # Docker image name
 DOCKER_IMAGE = "rwidjaja/atscale-gatling:latest"
 
+# Set once the startup files/directories are known to exist, so repeat calls skip the syscalls
+_BASE_QUERY_VERIFIED = False
+_CONTROL_DIR_VERIFIED = False
+
 def create_base_query_file():
     """Create base_query.sql file if it doesn't exist"""
+    global _BASE_QUERY_VERIFIED
+    if _BASE_QUERY_VERIFIED:
+        return
     config_dir = "working_dir/config"
     base_query_path = os.path.join(config_dir, "base_query.sql")
     
@@ -169,6 +189,7 @@ def create_base_query_file():
         print("✅ base_query.sql created successfully")
     else:
         print(f"✅ base_query.sql already exists in {config_dir}")
+    _BASE_QUERY_VERIFIED = True
 
 def check_docker_image():
     """Check if Docker image exists"""
@@ -192,102 +213,151 @@ def pull_docker_image():
         print(f"❌ Failed to pull Docker image: {result.stderr}")
         return False
 
+# True once the image is known to be present; ATSCALE_SKIP_DOCKER_CHECK=1 skips the check entirely
+_IMAGE_PRESENT = None
+
 def ensure_docker_image():
     """Ensure Docker image is available, pull if not"""
+    global _IMAGE_PRESENT
+    if _IMAGE_PRESENT or os.environ.get("ATSCALE_SKIP_DOCKER_CHECK") == "1":
+        return True
+
     if check_docker_image():
+        _IMAGE_PRESENT = True
         return True
     
     print(f"🐳 Docker image '{DOCKER_IMAGE}' not found locally")
-    return pull_docker_image()
+    _IMAGE_PRESENT = pull_docker_image()
+    return _IMAGE_PRESENT
 
 def run_xmla_query(xml_body: str):
     url = f"https://{HOST}:10502/xmla/default"
-    resp = requests.post(
-        url,
-        data=xml_body.encode("utf-8"),
-        headers={"Content-Type": "text/xml"},
-        auth=(USERNAME, PASSWORD),
-        verify=False
-    )
+    resp = SESSION.post(url, data=xml_body.encode("utf-8"))
     resp.raise_for_status()
-    return resp.text
-
-def parse_catalogs(xml_text: str):
-    root = ET.fromstring(xml_text)
-    return [el.text for el in root.findall(".//{urn:schemas-microsoft-com:xml-analysis:rowset}CATALOG_NAME")]
-
-def parse_cubes(xml_text: str):
-    root = ET.fromstring(xml_text)
-    return [el.text for el in root.findall(".//{urn:schemas-microsoft-com:xml-analysis:rowset}CUBE_NAME")]
+    return resp.content
+
+ROWSET_NS = "urn:schemas-microsoft-com:xml-analysis:rowset"
+CATALOG_TAG = f"{{{ROWSET_NS}}}CATALOG_NAME"
+CUBE_TAG = f"{{{ROWSET_NS}}}CUBE_NAME"
+
+def parse_rowset_column(xml_bytes: bytes, tag: str):
+    """Stream-parse an XMLA rowset, collecting the text of each `tag` element"""
+    values = []
+    if etree is not None:
+        # lxml filters by tag in C and only hands matching elements back
+        for _, el in etree.iterparse(io.BytesIO(xml_bytes), events=("end",), tag=tag):
+            values.append(el.text)
+            el.clear()
+        return values
+
+    for _, el in ET.iterparse(io.BytesIO(xml_bytes), events=("end",)):
+        if el.tag == tag:
+            values.append(el.text)
+            el.clear()
+    return values
+
+def parse_catalogs(xml_bytes: bytes):
+    return parse_rowset_column(xml_bytes, CATALOG_TAG)
+
+def parse_cubes(xml_bytes: bytes):
+    return parse_rowset_column(xml_bytes, CUBE_TAG)
+
+def build_properties_trailer():
+    """Postgres, system, AWS and Snowflake properties; these depend only on config.json"""
+    parts = [
+        f"atscale.postgres.jdbc.url=jdbc:postgresql://{POSTGRES_HOST}:10520/atscale\n",
+        "atscale.postgres.jdbc.username=atscale\n",
+        "atscale.postgres.jdbc.password=atscale\n",
+        "#System Parameter\n",
+        "atscale.gatling.throttle.ms=5\n",
+        "atscale.xmla.maxConnectionsPerHost=20\n",
+        "atscale.xmla.useAggregates=true\n",
+        "atscale.xmla.generateAggregates=false\n",
+        "atscale.xmla.useQueryCache=false\n",
+        "atscale.xmla.useAggregateCache=true\n",
+        "atscale.jdbc.useAggregates=true\n",
+        "atscale.jdbc.generateAggregates=false\n",
+        "atscale.jdbc.useLocalCache=false\n",
+    ]
+    # Add AWS Secret Manager configuration only if values are present
+    if AWS_REGION or AWS_SECRETS_KEY:
+        parts.append("#AWS Secret Manager\n")
+        if AWS_REGION:
+            parts.append(f"aws.region={AWS_REGION}\n")
+        if AWS_SECRETS_KEY:
+            parts.append(f"aws.secrets-key={AWS_SECRETS_KEY}\n")
+        parts.append("\n")
+
+    # Add Snowflake Properties for Archiving Logs to Snowflake only if account is present
+    if SNOWFLAKE_ACCOUNT:
+        parts.append("#Snowflake Properties for Archiving Logs to Snowflake\n")
+        parts.append(f"snowflake.archive.account={SNOWFLAKE_ACCOUNT}\n")
+        if SNOWFLAKE_WAREHOUSE:
+            parts.append(f"snowflake.archive.warehouse={SNOWFLAKE_WAREHOUSE}\n")
+        if SNOWFLAKE_DATABASE:
+            parts.append(f"snowflake.archive.database={SNOWFLAKE_DATABASE}\n")
+        if SNOWFLAKE_SCHEMA:
+            parts.append(f"snowflake.archive.schema={SNOWFLAKE_SCHEMA}\n")
+        if SNOWFLAKE_ROLE:
+            parts.append(f"snowflake.archive.role={SNOWFLAKE_ROLE}\n")
+        if SNOWFLAKE_USERNAME:
+            parts.append(f"snowflake.archive.username={SNOWFLAKE_USERNAME}\n")
+        if SNOWFLAKE_PASSWORD:
+            parts.append(f"snowflake.archive.password={SNOWFLAKE_PASSWORD}\n")
+    return "".join(parts)
+
+PROPERTIES_TRAILER = build_properties_trailer()
+
+# Per-cube block of systems.properties, filled once for each selected pair
+CUBE_TEMPLATE = (
+    "atscale.{cube_key}.jdbc.url=jdbc:postgresql://{HOST}:15432/{catalog_jdbc}\n"
+    "atscale.{cube_key}.jdbc.username={USERNAME}\n"
+    "atscale.{cube_key}.jdbc.password={PASSWORD}\n"
+    "atscale.{cube_key}.jdbc.maxPoolSize=10\n"
+    "atscale.{cube_key}.jdbc.log.resultset.rows=true\n"
+    "atscale.{cube_key}.xmla.auth.url=https://{HOST}:10500/default/auth\n"
+    "atscale.{cube_key}.xmla.url=https://{HOST}:10502/xmla/default/{TOKEN}\n"
+    "atscale.{cube_key}.xmla.cube={cube}\n"
+    "atscale.{cube_key}.xmla.catalog={catalog}\n"
+    "atscale.{cube_key}.xmla.log.responsebody=true\n"
+    "atscale.{cube_key}.xmla.auth.username={USERNAME}\n"
+    "atscale.{cube_key}.xmla.auth.password={PASSWORD}\n"
+    "# \n"
+)
 
 def write_systems_properties(selected_pairs):
     os.makedirs("working_dir/config", exist_ok=True)
     filepath = "working_dir/config/systems.properties"
 
-    cubes = [pair.split("::")[1].strip() for pair in selected_pairs]
-    catalogs = [pair.split("::")[0].strip() for pair in selected_pairs]
-
-    with open(filepath, "w") as f:
-        f.write("atscale.schema.type=installer\n")
-        f.write("atscale.models=" + ", ".join(catalogs) + "\n")
-
-        for pair in selected_pairs:
-            catalog, cube = [p.strip() for p in pair.split("::")]
-            cube_key = cube.replace(" ", "_")
-            catalog_jdbc_name = catalog.replace(" ", "%20")
-
-            f.write(f"atscale.{cube_key}.jdbc.url=jdbc:postgresql://{HOST}:15432/{catalog_jdbc_name}\n")
-            f.write(f"atscale.{cube_key}.jdbc.username={USERNAME}\n")
-            f.write(f"atscale.{cube_key}.jdbc.password={PASSWORD}\n")
-            f.write(f"atscale.{cube_key}.jdbc.maxPoolSize=10\n")
-            f.write(f"atscale.{cube_key}.jdbc.log.resultset.rows=true\n")
-            f.write(f"atscale.{cube_key}.xmla.auth.url=https://{HOST}:10500/default/auth\n")
-            f.write(f"atscale.{cube_key}.xmla.url=https://{HOST}:10502/xmla/default/{TOKEN}\n")
-            f.write(f"atscale.{cube_key}.xmla.cube={cube}\n")
-            f.write(f"atscale.{cube_key}.xmla.catalog={catalog}\n")
-            f.write(f"atscale.{cube_key}.xmla.log.responsebody=true\n")
-            f.write(f"atscale.{cube_key}.xmla.auth.username={USERNAME}\n")
-            f.write(f"atscale.{cube_key}.xmla.auth.password={PASSWORD}\n")
-            f.write("# \n")
-
-        f.write(f"atscale.postgres.jdbc.url=jdbc:postgresql://{POSTGRES_HOST}:10520/atscale\n")
-        f.write("atscale.postgres.jdbc.username=atscale\n")
-        f.write("atscale.postgres.jdbc.password=atscale\n")
-        f.write("#System Parameter\n")
-        f.write("atscale.gatling.throttle.ms=5\n")
-        f.write("atscale.xmla.maxConnectionsPerHost=20\n")
-        f.write("atscale.xmla.useAggregates=true\n")
-        f.write("atscale.xmla.generateAggregates=false\n")
-        f.write("atscale.xmla.useQueryCache=false\n")
-        f.write("atscale.xmla.useAggregateCache=true\n")
-        f.write("atscale.jdbc.useAggregates=true\n")
-        f.write("atscale.jdbc.generateAggregates=false\n")
-        f.write("atscale.jdbc.useLocalCache=false\n")
-        # Add AWS Secret Manager configuration only if values are present
-        if AWS_REGION or AWS_SECRETS_KEY:
-            f.write("#AWS Secret Manager\n")
-            if AWS_REGION:
-                f.write(f"aws.region={AWS_REGION}\n")
-            if AWS_SECRETS_KEY:
-                f.write(f"aws.secrets-key={AWS_SECRETS_KEY}\n")
-            f.write("\n")
-
-        # Add Snowflake Properties for Archiving Logs to Snowflake only if account is present
-        if SNOWFLAKE_ACCOUNT:
-            f.write("#Snowflake Properties for Archiving Logs to Snowflake\n")
-            f.write(f"snowflake.archive.account={SNOWFLAKE_ACCOUNT}\n")
-            if SNOWFLAKE_WAREHOUSE:
-                f.write(f"snowflake.archive.warehouse={SNOWFLAKE_WAREHOUSE}\n")
-            if SNOWFLAKE_DATABASE:
-                f.write(f"snowflake.archive.database={SNOWFLAKE_DATABASE}\n")
-            if SNOWFLAKE_SCHEMA:
-                f.write(f"snowflake.archive.schema={SNOWFLAKE_SCHEMA}\n")
-            if SNOWFLAKE_ROLE:
-                f.write(f"snowflake.archive.role={SNOWFLAKE_ROLE}\n")
-            if SNOWFLAKE_USERNAME:
-                f.write(f"snowflake.archive.username={SNOWFLAKE_USERNAME}\n")
-            if SNOWFLAKE_PASSWORD:
-                f.write(f"snowflake.archive.password={SNOWFLAKE_PASSWORD}\n")
+    # (catalog, cube, cube_key, catalog_jdbc) per pair, split and escaped once
+    parsed = [
+        (catalog, cube, cube.replace(" ", "_"), catalog.replace(" ", "%20"))
+        for catalog, cube in (
+            [p.strip() for p in pair.split("::", 1)] for pair in selected_pairs
+        )
+    ]
+
+    parts = ["atscale.schema.type=installer\n",
+             "atscale.models=" + ", ".join(entry[0] for entry in parsed) + "\n"]
+
+    for catalog, cube, cube_key, catalog_jdbc_name in parsed:
+        parts.append(CUBE_TEMPLATE.format_map({
+            "cube_key": cube_key, "cube": cube, "catalog": catalog,
+            "catalog_jdbc": catalog_jdbc_name, "HOST": HOST, "TOKEN": TOKEN,
+            "USERNAME": USERNAME, "PASSWORD": PASSWORD,
+        }))
+
+    parts.append(PROPERTIES_TRAILER)
+
+    # One unbuffered write of the whole file, no Python file object in between
+    data = "".join(parts).encode("utf-8")
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
                 
     print(f"✅ systems.properties written to {filepath}")
 
@@ -341,6 +411,19 @@ def build_docker_command(executor_name, docker_image):
     
     return cmd
 
+def read_log_tail(path, n, block_size=8192):
+    """Return the last n lines of a file, reading backwards from the end in blocks"""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    return data.decode("utf-8", errors="replace").splitlines()[-n:]
+
 def run_executor(executor_name):
     """Run executor using Docker container"""
     if not ensure_docker_image():
@@ -373,12 +456,11 @@ def run_executor(executor_name):
             print(f"❌ {executor_name} failed (see {log_path})")
             # Show last few lines for context
             try:
-                with open(log_path, "r") as f:
-                    lines = f.readlines()
-                    if lines:
-                        print("Last few lines of log:")
-                        for line in lines[-10:]:
-                            print(f"  {line.strip()}")
+                lines = read_log_tail(log_path, 10)
+                if lines:
+                    print("Last few lines of log:")
+                    for line in lines:
+                        print(f"  {line.strip()}")
             except:
                 pass
             return False
@@ -418,8 +500,11 @@ def select_and_run_executor():
 
 def ensure_control_directory():
     """Ensure control directory exists for stop signals"""
+    global _CONTROL_DIR_VERIFIED
     control_dir = os.path.join("working_dir", "control")
-    os.makedirs(control_dir, exist_ok=True)
+    if not _CONTROL_DIR_VERIFIED:
+        os.makedirs(control_dir, exist_ok=True)
+        _CONTROL_DIR_VERIFIED = True
     return control_dir
 
 def create_stop_simulation_file():
@@ -462,15 +547,23 @@ def main():
         print("   Please check your config.json credentials and network connectivity")
         sys.exit(1)
 
+    # Query every catalog's cubes concurrently; collect by catalog to keep the listing order
+    cubes_by_catalog = {}
+    if catalogs:
+        with ThreadPoolExecutor(max_workers=min(16, len(catalogs))) as ex:
+            futures = {ex.submit(run_xmla_query, CUBE_QUERY_TEMPLATE.format(catalog=cat)): cat
+                       for cat in catalogs}
+            for fut in as_completed(futures):
+                cat = futures[fut]
+                try:
+                    cubes_by_catalog[cat] = parse_cubes(fut.result())
+                except Exception as e:
+                    print(f"⚠️  Failed to get cubes for catalog {cat}: {e}")
+
     results = []
     for cat in catalogs:
-        try:
-            cube_xml = run_xmla_query(CUBE_QUERY_TEMPLATE.format(catalog=cat))
-            cubes = parse_cubes(cube_xml)
-            for cube in cubes:
-                results.append(f"{cat} :: {cube}")
-        except Exception as e:
-            print(f"⚠️  Failed to get cubes for catalog {cat}: {e}")
+        for cube in cubes_by_catalog.get(cat, []):
+            results.append(f"{cat} :: {cube}")
 
     if not results:
         print("❌ No cubes found. Please check your AtScale instance and credentials.")
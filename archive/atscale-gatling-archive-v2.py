@@ -1,11 +1,34 @@
 import requests
 import xml.etree.ElementTree as ET
 import json
+import io
 import sys
 import subprocess
 import os
+import time
+import argparse
+import asyncio
+import tempfile
+import shutil
+import ssl
+from dataclasses import dataclass, field, fields, MISSING
+from functools import lru_cache
 import urllib3
-from InquirerPy import inquirer
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+try:
+    import httpx
+except ImportError:
+    httpx = None
+try:
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 
 # Suppress SSL warnings since verify=False is used
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -16,22 +39,74 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 with open("config.json") as f:
     cfg = json.load(f)
 
-USERNAME = cfg["username"]
-PASSWORD = cfg["password"]
-HOST = cfg["host"]  # e.g. "ubuntu-atscale.atscaledomain.com"
-TOKEN = cfg["token"]  # e.g. "37022d31-a848-4e89-71de-7047cc69ee77"
-PROXY = cfg.get("proxy", "")
-PROXYPORT = cfg.get("proxyport", "")    
-POSTGRES_HOST = cfg["postgres_host"]
-AWS_REGION = cfg.get("aws.region", "")
-AWS_SECRETS_KEY = cfg.get("aws.secrets-key", "")
-SNOWFLAKE_ACCOUNT = cfg.get("snowflake.archive.account", "")
-SNOWFLAKE_WAREHOUSE = cfg.get("snowflake.archive.warehouse", "")
-SNOWFLAKE_DATABASE = cfg.get("snowflake.archive.database", "")
-SNOWFLAKE_SCHEMA = cfg.get("snowflake.archive.schema", "")
-SNOWFLAKE_ROLE = cfg.get("snowflake.archive.role", "")
-SNOWFLAKE_USERNAME = cfg.get("snowflake.archive.username", "")
-SNOWFLAKE_PASSWORD = cfg.get("snowflake.archive.password", "")
+# slots=True needs Python 3.10 (setup.py allows 3.7), and a hand-written
+# __slots__ clashes with the field defaults, so Config is frozen only
+@dataclass(frozen=True)
+class Config:
+    """Validated config.json values, read once at startup"""
+    username: str
+    password: str
+    host: str  # e.g. "ubuntu-atscale.atscaledomain.com"
+    token: str  # e.g. "37022d31-a848-4e89-71de-7047cc69ee77"
+    postgres_host: str
+    proxy: str = ""
+    proxyport: str = ""
+    aws_region: str = field(default="", metadata={"key": "aws.region"})
+    aws_secrets_key: str = field(default="", metadata={"key": "aws.secrets-key"})
+    snowflake_account: str = field(default="", metadata={"key": "snowflake.archive.account"})
+    snowflake_warehouse: str = field(default="", metadata={"key": "snowflake.archive.warehouse"})
+    snowflake_database: str = field(default="", metadata={"key": "snowflake.archive.database"})
+    snowflake_schema: str = field(default="", metadata={"key": "snowflake.archive.schema"})
+    snowflake_role: str = field(default="", metadata={"key": "snowflake.archive.role"})
+    snowflake_username: str = field(default="", metadata={"key": "snowflake.archive.username"})
+    snowflake_password: str = field(default="", metadata={"key": "snowflake.archive.password"})
+
+    @classmethod
+    def from_dict(cls, raw):
+        """Build a Config from parsed config.json, failing fast on missing required keys"""
+        values = {}
+        missing = []
+        for f in fields(cls):
+            key = f.metadata.get("key", f.name)
+            if key in raw:
+                values[f.name] = raw[key]
+            elif f.default is MISSING:
+                missing.append(key)
+        if missing:
+            raise SystemExit(f"❌ config.json is missing required keys: {', '.join(missing)}")
+        return cls(**values)
+
+CFG = Config.from_dict(cfg)
+
+# Catalog/cube discovery cache (seconds before a cached listing is refetched)
+DISCOVERY_CACHE_PATH = "working_dir/config/catalog_cube_cache.json"
+DISCOVERY_CACHE_TTL = int(cfg.get("discovery_cache_ttl", 3600))
+
+# ----------------------------
+# HTTP session (keep-alive, pooled connections)
+# ----------------------------
+class SharedSSLAdapter(HTTPAdapter):
+    """HTTPAdapter that hands every pooled connection the same SSL context"""
+    def __init__(self, ssl_context, **kwargs):
+        self.ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self.ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+# Built once: no verification (matches verify=False), TLS 1.2+, session tickets allowed
+SSL_CONTEXT = ssl.create_default_context()
+SSL_CONTEXT.check_hostname = False
+SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+SSL_CONTEXT.minimum_version = ssl.TLSVersion.TLSv1_2
+SSL_CONTEXT.options &= ~ssl.OP_NO_TICKET
+
+SESSION = requests.Session()
+SESSION.mount("https://", SharedSSLAdapter(SSL_CONTEXT, pool_connections=16, pool_maxsize=16, max_retries=2))
+SESSION.auth = (CFG.username, CFG.password)
+SESSION.verify = False
+SESSION.headers.update({"Content-Type": "text/xml"})
 
 # ----------------------------
 # SOAP Templates
@@ -78,6 +153,13 @@ CUBE_QUERY_TEMPLATE = """<?xml version="1.0" encoding="utf-8"?>
   </soap:Body>
 </soap:Envelope>"""
 
+# Request bodies pre-encoded once; the cube template takes the catalog via %-substitution
+CATALOG_QUERY_B = CATALOG_QUERY.encode("utf-8")
+CUBE_QUERY_TEMPLATE_B = CUBE_QUERY_TEMPLATE.replace("{catalog}", "%s").encode("utf-8")
+
+def cube_query_body(catalog: str) -> bytes:
+    return CUBE_QUERY_TEMPLATE_B % catalog.encode("utf-8")
+
 BASE_SQL_QUERY = """SELECT
     q.service,
     q.query_language,
@@ -120,14 +202,25 @@ GROUP BY
     6
 ORDER BY 3"""
 
+# Every directory the controller writes into; created once by ensure_dirs() in main
+REQUIRED_DIRS = (
+    "working_dir/config",
+    "working_dir/run_logs",
+    "working_dir/app_logs",
+    "working_dir/queries",
+    "target/classes",
+)
+
+def ensure_dirs():
+    """Create the working directories up front so later writes can assume they exist"""
+    for d in REQUIRED_DIRS:
+        os.makedirs(d, exist_ok=True)
+
 def create_base_query_file():
     """Create base_query.sql file if it doesn't exist"""
     config_dir = "working_dir/config"
     base_query_path = os.path.join(config_dir, "base_query.sql")
     
-    # Create config directory if it doesn't exist
-    os.makedirs(config_dir, exist_ok=True)
-    
     # Create base_query.sql if it doesn't exist
     if not os.path.exists(base_query_path):
         print(f"📝 Creating base_query.sql in {config_dir}")
@@ -139,9 +232,10 @@ def create_base_query_file():
 # ----------------------------
 # Proxy Configuration
 # ----------------------------
+@lru_cache(maxsize=None)
 def should_use_proxy(executor):
     """Determine if proxy should be used for this executor"""
-    if not PROXY or not PROXYPORT:
+    if not CFG.proxy or not CFG.proxyport:
         return False
     
     # Only use proxy for archive to snowflake steps
@@ -152,180 +246,339 @@ def should_use_proxy(executor):
     
     return executor in archive_executors
 
-def get_proxy_environment():
+def _build_proxy_env():
     """Get proxy environment variables if proxy is configured"""
-    if not PROXY or not PROXYPORT:
+    if not CFG.proxy or not CFG.proxyport:
         return {}
     
     return {
-        'HTTP_PROXY': f'http://{PROXY}:{PROXYPORT}',
-        'HTTPS_PROXY': f'http://{PROXY}:{PROXYPORT}',
-        'http_proxy': f'http://{PROXY}:{PROXYPORT}',
-        'https_proxy': f'http://{PROXY}:{PROXYPORT}',
-        'NO_PROXY': f'localhost,127.0.0.1,{HOST}',
-        'no_proxy': f'localhost,127.0.0.1,{HOST}'
+        'HTTP_PROXY': f'http://{CFG.proxy}:{CFG.proxyport}',
+        'HTTPS_PROXY': f'http://{CFG.proxy}:{CFG.proxyport}',
+        'http_proxy': f'http://{CFG.proxy}:{CFG.proxyport}',
+        'https_proxy': f'http://{CFG.proxy}:{CFG.proxyport}',
+        'NO_PROXY': f'localhost,127.0.0.1,{CFG.host}',
+        'no_proxy': f'localhost,127.0.0.1,{CFG.host}'
     }
 
-def get_proxy_java_properties():
+def _build_proxy_java_props():
     """Get Java system properties for proxy configuration"""
-    if not PROXY or not PROXYPORT:
-        return []
+    if not CFG.proxy or not CFG.proxyport:
+        return ()
     
-    return [
-        f'-Dhttp.proxyHost={PROXY}',
-        f'-Dhttp.proxyPort={PROXYPORT}',
-        f'-Dhttps.proxyHost={PROXY}',
-        f'-Dhttps.proxyPort={PROXYPORT}',
-        f'-Dhttp.nonProxyHosts=localhost|127.0.0.1|{HOST}'
-    ]
+    return (
+        f'-Dhttp.proxyHost={CFG.proxy}',
+        f'-Dhttp.proxyPort={CFG.proxyport}',
+        f'-Dhttps.proxyHost={CFG.proxy}',
+        f'-Dhttps.proxyPort={CFG.proxyport}',
+        f'-Dhttp.nonProxyHosts=localhost|127.0.0.1|{CFG.host}'
+    )
+
+# Proxy settings depend only on config.json, so build them once at import
+PROXY_ENV = _build_proxy_env()
+PROXY_JAVA_PROPS = _build_proxy_java_props()
 
 # ----------------------------
 # Helpers
 # ----------------------------
-def run_xmla_query(xml_body: str):
-    url = f"https://{HOST}:10502/xmla/default"
-    resp = requests.post(
-        url,
-        data=xml_body.encode("utf-8"),
-        headers={"Content-Type": "text/xml"},
-        auth=(USERNAME, PASSWORD),
-        verify=False
-    )
+def run_xmla_query(xml_body: bytes) -> bytes:
+    """POST a SOAP body and return the raw response bytes for the XML parser"""
+    url = f"https://{CFG.host}:10502/xmla/default"
+    resp = SESSION.post(url, data=xml_body, timeout=(5, 60))
     resp.raise_for_status()
-    return resp.text
+    return resp.content
 
-def parse_catalogs(xml_text: str):
-    root = ET.fromstring(xml_text)
-    return [el.text for el in root.findall(".//{urn:schemas-microsoft-com:xml-analysis:rowset}CATALOG_NAME")]
+ROWSET_NS = "urn:schemas-microsoft-com:xml-analysis:rowset"
 
-def parse_cubes(xml_text: str):
-    root = ET.fromstring(xml_text)
-    return [el.text for el in root.findall(".//{urn:schemas-microsoft-com:xml-analysis:rowset}CUBE_NAME")]
+if etree is not None:
+    # libxml2-backed parser and XPath selectors, compiled once
+    XML_PARSER = etree.XMLParser(huge_tree=False, recover=False)
+    ROW_XPATHS = {
+        tag: etree.XPath(f".//r:{tag}/text()", namespaces={"r": ROWSET_NS})
+        for tag in ("CATALOG_NAME", "CUBE_NAME")
+    }
+
+def parse_rows(xml_bytes: bytes, tag: str) -> list:
+    """Collect the text of every `tag` element in an XMLA rowset"""
+    if etree is not None:
+        root = etree.fromstring(xml_bytes, XML_PARSER)
+        return [str(text) for text in ROW_XPATHS[tag](root)]
+
+    # Fall back to streaming the stdlib parser when lxml is not installed
+    target = "{" + ROWSET_NS + "}" + tag
+    results = []
+    for _, elem in ET.iterparse(io.BytesIO(xml_bytes), events=("end",)):
+        if elem.tag == target:
+            results.append(elem.text)
+            elem.clear()
+    return results
+
+def parse_catalogs(xml_bytes: bytes) -> list:
+    return parse_rows(xml_bytes, "CATALOG_NAME")
+
+def parse_cubes(xml_bytes: bytes) -> list:
+    return parse_rows(xml_bytes, "CUBE_NAME")
+
+async def _discover_cubes_async():
+    """Fetch catalogs, then every catalog's cubes concurrently over one httpx client"""
+    url = f"https://{CFG.host}:10502/xmla/default"
+    async with httpx.AsyncClient(
+        verify=SSL_CONTEXT, http2=HTTP2_AVAILABLE, auth=(CFG.username, CFG.password),
+        headers={"Content-Type": "text/xml"}, timeout=httpx.Timeout(60.0, connect=5.0)
+    ) as client:
+        # Same cap as the thread-pool paths so many catalogs don't flood the endpoint
+        limit = asyncio.Semaphore(8)
+
+        async def post(body):
+            async with limit:
+                resp = await client.post(url, content=body)
+            resp.raise_for_status()
+            return resp.content
+
+        catalogs = parse_catalogs(await post(CATALOG_QUERY_B))
+        cube_xmls = await asyncio.gather(
+            *(post(cube_query_body(c)) for c in catalogs)
+        )
+    return {cat: parse_cubes(cube_xml) for cat, cube_xml in zip(catalogs, cube_xmls)}
+
+def discover_cubes_by_catalog():
+    """Query XMLA for every catalog and its cubes, returning {catalog: [cubes]}"""
+    if httpx is not None:
+        return asyncio.run(_discover_cubes_async())
+
+    cat_xml = run_xmla_query(CATALOG_QUERY_B)
+    catalogs = parse_catalogs(cat_xml)
+
+    # Fire all cube queries concurrently; each one is a network round-trip
+    cube_map = {}
+    if catalogs:
+        with ThreadPoolExecutor(max_workers=min(16, len(catalogs))) as ex:
+            cube_xmls = list(ex.map(
+                lambda c: (c, run_xmla_query(cube_query_body(c))),
+                catalogs
+            ))
+        for cat, cube_xml in cube_xmls:
+            cube_map[cat] = parse_cubes(cube_xml)
+    return cube_map
+
+def load_discovery_cache():
+    """Return the cached {catalog: [cubes]} map for the configured host, or None if missing/stale"""
+    try:
+        with open(DISCOVERY_CACHE_PATH) as f:
+            entry = json.load(f).get(CFG.host)
+    except (OSError, ValueError):
+        return None
+
+    if not entry or time.time() - entry.get("fetched_at", 0) > DISCOVERY_CACHE_TTL:
+        return None
+    return entry.get("cubes")
+
+def save_discovery_cache(cube_map):
+    """Store the {catalog: [cubes]} map for the configured host alongside entries for other hosts"""
+    try:
+        with open(DISCOVERY_CACHE_PATH) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+
+    cache[CFG.host] = {"fetched_at": time.time(), "cubes": cube_map}
+    with open(DISCOVERY_CACHE_PATH, "w") as f:
+        json.dump(cache, f, indent=2)
+
+def write_if_changed(filepath, data):
+    """Atomically replace filepath with data unless its contents already match"""
+    new_bytes = data.encode("utf-8")
+    try:
+        with open(filepath, "rb") as f:
+            if f.read() == new_bytes:
+                return False
+    except OSError:
+        pass
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(filepath) or ".", prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(new_bytes)
+        # mkstemp creates 0600; the container may read the mount as another uid
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return True
+
+# Connection block written to systems.properties for each selected catalog::cube
+PER_CUBE_TEMPLATE = (
+    "atscale.{cube_key}.jdbc.url=jdbc:postgresql://{host}:15432/{catalog_jdbc}\n"
+    "atscale.{cube_key}.jdbc.username={username}\n"
+    "atscale.{cube_key}.jdbc.password={password}\n"
+    "atscale.{cube_key}.jdbc.maxPoolSize=10\n"
+    "atscale.{cube_key}.jdbc.log.resultset.rows=true\n"
+    "atscale.{cube_key}.xmla.auth.url=https://{host}:10500/default/auth\n"
+    "atscale.{cube_key}.xmla.url=https://{host}:10502/xmla/default/{token}\n"
+    "atscale.{cube_key}.xmla.cube={cube}\n"
+    "atscale.{cube_key}.xmla.catalog={catalog}\n"
+    "atscale.{cube_key}.xmla.log.responsebody=true\n"
+    "atscale.{cube_key}.xmla.auth.username={username}\n"
+    "atscale.{cube_key}.xmla.auth.password={password}\n"
+    "# \n"
+)
 
 def write_systems_properties(selected_pairs):
-    os.makedirs("working_dir/config", exist_ok=True)
     filepath = "working_dir/config/systems.properties"
 
-    cubes = [pair.split("::")[1].strip() for pair in selected_pairs]
-    catalogs = [pair.split("::")[0].strip() for pair in selected_pairs]
-
-    with open(filepath, "w") as f:
-        f.write("atscale.schema.type=installer\n")
-        f.write("atscale.models=" + ", ".join(catalogs) + "\n")
-
-        for pair in selected_pairs:
-            catalog, cube = [p.strip() for p in pair.split("::")]
-            cube_key = cube.replace(" ", "_")
-            catalog_jdbc_name = catalog.replace(" ", "%20")
-
-            f.write(f"atscale.{cube_key}.jdbc.url=jdbc:postgresql://{HOST}:15432/{catalog_jdbc_name}\n")
-            f.write(f"atscale.{cube_key}.jdbc.username={USERNAME}\n")
-            f.write(f"atscale.{cube_key}.jdbc.password={PASSWORD}\n")
-            f.write(f"atscale.{cube_key}.jdbc.maxPoolSize=10\n")
-            f.write(f"atscale.{cube_key}.jdbc.log.resultset.rows=true\n")
-            f.write(f"atscale.{cube_key}.xmla.auth.url=https://{HOST}:10500/default/auth\n")
-            f.write(f"atscale.{cube_key}.xmla.url=https://{HOST}:10502/xmla/default/{TOKEN}\n")
-            f.write(f"atscale.{cube_key}.xmla.cube={cube}\n")
-            f.write(f"atscale.{cube_key}.xmla.catalog={catalog}\n")
-            f.write(f"atscale.{cube_key}.xmla.log.responsebody=true\n")
-            f.write(f"atscale.{cube_key}.xmla.auth.username={USERNAME}\n")
-            f.write(f"atscale.{cube_key}.xmla.auth.password={PASSWORD}\n")
-            f.write("# \n")
-
-        f.write(f"atscale.postgres.jdbc.url=jdbc:postgresql://{POSTGRES_HOST}:10520/atscale\n")
-        f.write("atscale.postgres.jdbc.username=atscale\n")
-        f.write("atscale.postgres.jdbc.password=atscale\n")
-        f.write("#System Parameter\n")
-        f.write("atscale.gatling.throttle.ms=5\n")
-        f.write("atscale.xmla.maxConnectionsPerHost=20\n")
-        f.write("atscale.xmla.useAggregates=true\n")
-        f.write("atscale.xmla.generateAggregates=false\n")
-        f.write("atscale.xmla.useQueryCache=false\n")
-        f.write("atscale.xmla.useAggregateCache=true\n")
-        f.write("atscale.jdbc.useAggregates=true\n")
-        f.write("atscale.jdbc.generateAggregates=false\n")
-        f.write("atscale.jdbc.useLocalCache=false\n")
-        # Add AWS Secret Manager configuration only if values are present
-        if AWS_REGION or AWS_SECRETS_KEY:
-            f.write("#AWS Secret Manager\n")
-            if AWS_REGION:
-                f.write(f"aws.region={AWS_REGION}\n")
-            if AWS_SECRETS_KEY:
-                f.write(f"aws.secrets-key={AWS_SECRETS_KEY}\n")
-            f.write("\n")
-
-        # Add Snowflake Properties for Archiving Logs to Snowflake only if account is present
-        if SNOWFLAKE_ACCOUNT:
-            f.write("#Snowflake Properties for Archiving Logs to Snowflake\n")
-            f.write(f"snowflake.archive.account={SNOWFLAKE_ACCOUNT}\n")
-            if SNOWFLAKE_WAREHOUSE:
-                f.write(f"snowflake.archive.warehouse={SNOWFLAKE_WAREHOUSE}\n")
-            if SNOWFLAKE_DATABASE:
-                f.write(f"snowflake.archive.database={SNOWFLAKE_DATABASE}\n")
-            if SNOWFLAKE_SCHEMA:
-                f.write(f"snowflake.archive.schema={SNOWFLAKE_SCHEMA}\n")
-            if SNOWFLAKE_ROLE:
-                f.write(f"snowflake.archive.role={SNOWFLAKE_ROLE}\n")
-            if SNOWFLAKE_USERNAME:
-                f.write(f"snowflake.archive.username={SNOWFLAKE_USERNAME}\n")
-            if SNOWFLAKE_PASSWORD:
-                f.write(f"snowflake.archive.password={SNOWFLAKE_PASSWORD}\n")
-                
-    print(f"✅ systems.properties written to {filepath}")
+    parsed = [tuple(p.strip() for p in pair.split("::", 1)) for pair in selected_pairs]
+    catalogs = [catalog for catalog, _ in parsed]
+
+    parts = []
+    parts.append("atscale.schema.type=installer\n")
+    parts.append("atscale.models=" + ", ".join(catalogs) + "\n")
+
+    template_values = {
+        "host": CFG.host, "token": CFG.token,
+        "username": CFG.username, "password": CFG.password,
+    }
+    for catalog, cube in parsed:
+        cube_key = cube.replace(" ", "_")
+        catalog_jdbc_name = catalog.replace(" ", "%20")
+
+        parts.append(PER_CUBE_TEMPLATE.format_map(dict(
+            template_values, cube_key=cube_key, cube=cube,
+            catalog=catalog, catalog_jdbc=catalog_jdbc_name
+        )))
+
+    parts.append(f"atscale.postgres.jdbc.url=jdbc:postgresql://{CFG.postgres_host}:10520/atscale\n")
+    parts.append("atscale.postgres.jdbc.username=atscale\n")
+    parts.append("atscale.postgres.jdbc.password=atscale\n")
+    parts.append("#System Parameter\n")
+    parts.append("atscale.gatling.throttle.ms=5\n")
+    parts.append("atscale.xmla.maxConnectionsPerHost=20\n")
+    parts.append("atscale.xmla.useAggregates=true\n")
+    parts.append("atscale.xmla.generateAggregates=false\n")
+    parts.append("atscale.xmla.useQueryCache=false\n")
+    parts.append("atscale.xmla.useAggregateCache=true\n")
+    parts.append("atscale.jdbc.useAggregates=true\n")
+    parts.append("atscale.jdbc.generateAggregates=false\n")
+    parts.append("atscale.jdbc.useLocalCache=false\n")
+    # Add AWS Secret Manager configuration only if values are present
+    if CFG.aws_region or CFG.aws_secrets_key:
+        parts.append("#AWS Secret Manager\n")
+        if CFG.aws_region:
+            parts.append(f"aws.region={CFG.aws_region}\n")
+        if CFG.aws_secrets_key:
+            parts.append(f"aws.secrets-key={CFG.aws_secrets_key}\n")
+        parts.append("\n")
+
+    # Add Snowflake Properties for Archiving Logs to Snowflake only if account is present
+    if CFG.snowflake_account:
+        parts.append("#Snowflake Properties for Archiving Logs to Snowflake\n")
+        parts.append(f"snowflake.archive.account={CFG.snowflake_account}\n")
+        if CFG.snowflake_warehouse:
+            parts.append(f"snowflake.archive.warehouse={CFG.snowflake_warehouse}\n")
+        if CFG.snowflake_database:
+            parts.append(f"snowflake.archive.database={CFG.snowflake_database}\n")
+        if CFG.snowflake_schema:
+            parts.append(f"snowflake.archive.schema={CFG.snowflake_schema}\n")
+        if CFG.snowflake_role:
+            parts.append(f"snowflake.archive.role={CFG.snowflake_role}\n")
+        if CFG.snowflake_username:
+            parts.append(f"snowflake.archive.username={CFG.snowflake_username}\n")
+        if CFG.snowflake_password:
+            parts.append(f"snowflake.archive.password={CFG.snowflake_password}\n")
+
+    if write_if_changed(filepath, "".join(parts)):
+        print(f"✅ systems.properties written to {filepath}")
+    else:
+        print(f"✅ systems.properties unchanged at {filepath}")
 
     # Print summary of AWS/Snowflake configuration
     print("\nAWS/Snowflake Configuration Summary:")
-    if AWS_REGION:
-        print(f"  AWS Region: {AWS_REGION}")
-    if AWS_SECRETS_KEY:
-        print(f"  AWS Secrets Key: {AWS_SECRETS_KEY}")
+    if CFG.aws_region:
+        print(f"  AWS Region: {CFG.aws_region}")
+    if CFG.aws_secrets_key:
+        print(f"  AWS Secrets Key: {CFG.aws_secrets_key}")
     
-    if SNOWFLAKE_ACCOUNT:
-        print(f"  Snowflake Account: {SNOWFLAKE_ACCOUNT}")
-        if SNOWFLAKE_WAREHOUSE:
-            print(f"  Snowflake Warehouse: {SNOWFLAKE_WAREHOUSE}")
-        if SNOWFLAKE_DATABASE:
-            print(f"  Snowflake Database: {SNOWFLAKE_DATABASE}")
-        if SNOWFLAKE_SCHEMA:
-            print(f"  Snowflake Schema: {SNOWFLAKE_SCHEMA}")
-        if SNOWFLAKE_ROLE:
-            print(f"  Snowflake Role: {SNOWFLAKE_ROLE}")
-        if SNOWFLAKE_USERNAME:
-            print(f"  Snowflake Username: {SNOWFLAKE_USERNAME}")
-        if SNOWFLAKE_PASSWORD:
-            print(f"  Snowflake Password: {'*' * len(SNOWFLAKE_PASSWORD)}")
+    if CFG.snowflake_account:
+        print(f"  Snowflake Account: {CFG.snowflake_account}")
+        if CFG.snowflake_warehouse:
+            print(f"  Snowflake Warehouse: {CFG.snowflake_warehouse}")
+        if CFG.snowflake_database:
+            print(f"  Snowflake Database: {CFG.snowflake_database}")
+        if CFG.snowflake_schema:
+            print(f"  Snowflake Schema: {CFG.snowflake_schema}")
+        if CFG.snowflake_role:
+            print(f"  Snowflake Role: {CFG.snowflake_role}")
+        if CFG.snowflake_username:
+            print(f"  Snowflake Username: {CFG.snowflake_username}")
+        if CFG.snowflake_password:
+            print(f"  Snowflake Password: {'*' * len(CFG.snowflake_password)}")
     else:
         print("  Snowflake: Not configured")
 
+def run_and_tee(cmd, log_path, env=None):
+    """Run `cmd`, streaming its combined output to both the log file and stdout"""
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+        errors="replace",
+        env=env
+    )
+    with open(log_path, "w") as log_file:
+        for line in proc.stdout:
+            log_file.write(line)
+            sys.stdout.write(line)
+    return proc.wait()
+
 def run_docker(selected_executor):
+    cwd = os.getcwd()
     docker_cmd = [
         "docker", "run", "--rm",
         "--env-file", ".env",
         "--platform", "linux/amd64",
-        "-v", "$(pwd)/working_dir/config/systems.properties:/app/target/classes/systems.properties:ro",
-        "-v", "$(pwd)/working_dir/run_logs:/app/run_logs",
-        "-v", "$(pwd)/working_dir/app_logs:/app/app_logs",
-        "-v", "$(pwd)/working_dir/queries:/app/queries",
+        "-v", f"{cwd}/working_dir/config/systems.properties:/app/target/classes/systems.properties:ro",
+        "-v", f"{cwd}/working_dir/run_logs:/app/run_logs",
+        "-v", f"{cwd}/working_dir/app_logs:/app/app_logs",
+        "-v", f"{cwd}/working_dir/queries:/app/queries",
         "rwidjaja/atscale-gatling:latest"
     ]
 
     print("\nExecuting Docker command...")
-    os.makedirs("working_dir/run_logs", exist_ok=True)
     log_path = os.path.join("working_dir", "run_logs", "docker_output.log")
 
     try:
-        with open(log_path, "w") as log_file:
-            subprocess.run(
-                " ".join(docker_cmd),
-                shell=True,
-                check=True,
-                stdout=log_file,
-                stderr=log_file
-            )
+        returncode = run_and_tee(docker_cmd, log_path)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, docker_cmd)
         print(f"Docker run completed. Logs written to {log_path}")
     except subprocess.CalledProcessError as e:
         print(f"Docker run failed (see {log_path} for details): {e}")
         sys.exit(1)
+    except FileNotFoundError as e:
+        print(f"Docker run failed (is docker installed and on PATH?): {e}")
+        sys.exit(1)
+
+def stage_file(src, tgt):
+    """Make tgt match src, hardlinking where possible; returns False if it already did"""
+    try:
+        src_st = os.stat(src)
+        tgt_st = os.stat(tgt)
+        if src_st.st_mtime == tgt_st.st_mtime and src_st.st_size == tgt_st.st_size:
+            return False
+        os.unlink(tgt)
+    except FileNotFoundError:
+        pass
+
+    try:
+        os.link(src, tgt)
+    except OSError:
+        # Different filesystem or no hardlink support; copy2 keeps mtime for the guard above
+        shutil.copy2(src, tgt)
+    return True
+
+# Java vs Maven choice, remembered after the first run_local prompt
+_RUN_METHOD = None
 
 def run_local(selected_executor):
     """Run the selected executor locally using Maven"""
@@ -353,20 +606,13 @@ def run_local(selected_executor):
     print(f"🚀 Running {selected_executor} locally...")
     print(f"📝 Java class: {java_class}")
     
-    # Create necessary directories
-    os.makedirs("working_dir/run_logs", exist_ok=True)
-    os.makedirs("working_dir/app_logs", exist_ok=True)
-    os.makedirs("working_dir/queries", exist_ok=True)
-    
-    # Ensure target/classes exists and copy properties file
-    os.makedirs("target/classes", exist_ok=True)
+    # Copy properties file into target/classes
     properties_source = "working_dir/config/systems.properties"
     properties_target = "target/classes/systems.properties"
     
     if os.path.exists(properties_source):
-        import shutil
-        shutil.copy2(properties_source, properties_target)
-        print(f"📁 Copied {properties_source} to {properties_target}")
+        if stage_file(properties_source, properties_target):
+            print(f"📁 Copied {properties_source} to {properties_target}")
     else:
         print(f"⚠️  Warning: {properties_source} not found")
     
@@ -375,11 +621,9 @@ def run_local(selected_executor):
     try:
         # Check if we need to use proxy
         use_proxy = should_use_proxy(selected_executor)
-        proxy_env = get_proxy_environment()
-        proxy_java_props = get_proxy_java_properties()
         
         if use_proxy:
-            print(f"🔌 Using proxy: {PROXY}:{PROXYPORT}")
+            print(f"🔌 Using proxy: {CFG.proxy}:{CFG.proxyport}")
         
         # Option 1: Use java command directly with simple Log4j2 configuration
         java_cmd = [
@@ -389,7 +633,7 @@ def run_local(selected_executor):
         
         # Add proxy properties if needed
         if use_proxy:
-            java_cmd.extend(proxy_java_props)
+            java_cmd.extend(PROXY_JAVA_PROPS)
             
         java_cmd.extend([
             "-cp",
@@ -409,17 +653,21 @@ def run_local(selected_executor):
         
         # Add proxy properties to Maven if needed
         if use_proxy:
-            maven_cmd.extend(proxy_java_props)
+            maven_cmd.extend(PROXY_JAVA_PROPS)
         
-        # Let user choose which method to use
-        run_method = inquirer.select(
-            message="Select execution method:",
-            choices=[
-                {"name": "Java command (direct)", "value": "java"},
-                {"name": "Maven exec (recommended)", "value": "maven"}
-            ],
-            default="maven"
-        ).execute()
+        # Let user choose which method to use (asked once per session)
+        global _RUN_METHOD
+        if _RUN_METHOD is None:
+            from InquirerPy import inquirer
+            _RUN_METHOD = inquirer.select(
+                message="Select execution method:",
+                choices=[
+                    {"name": "Java command (direct)", "value": "java"},
+                    {"name": "Maven exec (recommended)", "value": "maven"}
+                ],
+                default="maven"
+            ).execute()
+        run_method = _RUN_METHOD
         
         if run_method == "maven":
             print(f"🔧 Running with Maven: {' '.join(maven_cmd)}")
@@ -431,30 +679,15 @@ def run_local(selected_executor):
             # For direct Java execution, we need to set both system properties and environment
             env = os.environ.copy()
             if use_proxy:
-                env.update(proxy_env)
+                env.update(PROXY_ENV)
         
-        with open(log_path, "w") as log_file:
-            if run_method == "maven":
-                result = subprocess.run(
-                    cmd_to_run,
-                    stdout=log_file,
-                    stderr=log_file,
-                    text=True
-                )
-            else:
-                result = subprocess.run(
-                    cmd_to_run,
-                    stdout=log_file,
-                    stderr=log_file,
-                    text=True,
-                    env=env
-                )
+        returncode = run_and_tee(cmd_to_run, log_path, env=env)
         
-        if result.returncode == 0:
+        if returncode == 0:
             print(f"✅ {selected_executor} completed successfully")
             print(f"📄 Logs written to {log_path}")
         else:
-            print(f"❌ {selected_executor} failed with exit code {result.returncode}")
+            print(f"❌ {selected_executor} failed with exit code {returncode}")
             print(f"📄 See {log_path} for details")
             
             # Show last few lines of log for quick debugging
@@ -491,6 +724,7 @@ def select_and_run_executor():
         "Exit"  # Add Exit option
     ]
 
+    from InquirerPy import inquirer
     try:
         selected_executor = inquirer.select(
             message="Select Executor to run:",
@@ -521,18 +755,29 @@ def select_and_run_executor():
 # Main
 # ----------------------------
 def main():
+    parser = argparse.ArgumentParser(description="AtScale Gatling Controller")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Ignore the cached catalog/cube listing and rediscover via XMLA")
+    args = parser.parse_args()
+
+    ensure_dirs()
+
     # First, select catalog/cube pairs and generate systems.properties
-    cat_xml = run_xmla_query(CATALOG_QUERY)
-    catalogs = parse_catalogs(cat_xml)
+    cube_map = None if args.refresh else load_discovery_cache()
+    if cube_map is None:
+        cube_map = discover_cubes_by_catalog()
+        save_discovery_cache(cube_map)
+    else:
+        print(f"📦 Using cached catalog/cube listing from {DISCOVERY_CACHE_PATH} (--refresh to rediscover)")
     create_base_query_file()
 
     results = []
-    for cat in catalogs:
-        cube_xml = run_xmla_query(CUBE_QUERY_TEMPLATE.format(catalog=cat))
-        cubes = parse_cubes(cube_xml)
+    for cat, cubes in cube_map.items():
         for cube in cubes:
             results.append(f"{cat} :: {cube}")
 
+    # Deferred so the prompt library loads only once there is something to ask
+    from InquirerPy import inquirer
     try:
         selected_pairs = inquirer.checkbox(
             message="Select Catalog/Cube pairs:",
@@ -554,8 +799,8 @@ def main():
     print("You can now run multiple executors with the same configuration.")
     
     # Show proxy status
-    if PROXY and PROXYPORT:
-        print(f"🔌 Proxy configured: {PROXY}:{PROXYPORT}")
+    if CFG.proxy and CFG.proxyport:
+        print(f"🔌 Proxy configured: {CFG.proxy}:{CFG.proxyport}")
         print("   (Will be used for ArchiveJdbcToSnowflake and ArchiveXmlaToSnowflake)")
     else:
         print("🔌 No proxy configured")
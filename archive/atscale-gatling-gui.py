@@ -1,27 +1,127 @@
-import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
 import threading
 import subprocess
+import shlex
+import hashlib
 import os
 import time
-import queue
+import selectors
 import requests
+from requests.adapters import HTTPAdapter
 import xml.etree.ElementTree as ET
+try:
+    from lxml import etree  # libxml2 parser; same findall API as ElementTree
+except ImportError:
+    etree = ET
+import io
 import json
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
 import sys
 import urllib3
 import argparse
+from collections import deque
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # Suppress SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# tkinter is imported on first GUI use so CLI runs never load it
+tk = ttk = scrolledtext = messagebox = None
+
+def load_tk():
+    """Import tkinter into the module globals used by the GUI"""
+    global tk, ttk, scrolledtext, messagebox
+    if tk is None:
+        import tkinter
+        from tkinter import ttk, scrolledtext, messagebox
+        tk = tkinter
+
+# XMLA rowset lookups, built once
+ROWSET_NS = "urn:schemas-microsoft-com:xml-analysis:rowset"
+CATALOG_PATH = f".//{{{ROWSET_NS}}}CATALOG_NAME"
+CUBE_TAG = f"{{{ROWSET_NS}}}CUBE_NAME"
+CATALOG_TAG = f"{{{ROWSET_NS}}}CATALOG_NAME"
+ROW_TAG = f"{{{ROWSET_NS}}}row"
+if etree is not ET:
+    # Compiled XPath returning text nodes directly, no Element objects
+    CATALOG_XPATH = etree.XPath("//r:CATALOG_NAME/text()", namespaces={"r": ROWSET_NS})
+else:
+    CATALOG_XPATH = None
+
+# Unrestricted MDSCHEMA_CUBES request: no Catalog property, so every catalog's cubes come back
+ALL_CUBES_QUERY = b"""<?xml version="1.0" encoding="utf-8"?>
+<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"
+               xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+               xmlns:xsd="http://www.w3.org/2001/XMLSchema">
+  <soap:Body>
+    <Execute xmlns="urn:schemas-microsoft-com:xml-analysis">
+      <Command>
+        <Statement>
+              SELECT [CATALOG_NAME], [CUBE_NAME] from $system.MDSCHEMA_CUBES
+        </Statement>
+      </Command>
+      <Properties>
+        <PropertyList>
+          <Cube>Default</Cube>
+        </PropertyList>
+      </Properties>
+    </Execute>
+  </soap:Body>
+</soap:Envelope>"""
+
 class AtScaleGatlingCore:
     """Core functionality that works for both GUI and CLI"""
     
+    _layout_done = False
+    
+    # systems.properties block for one selected catalog::cube pair
+    _PAIR_TEMPLATE = (
+        "atscale.{cube_key}.jdbc.url=jdbc:postgresql://{host}:15432/{catalog_jdbc}\n"
+        "atscale.{cube_key}.jdbc.username={username}\n"
+        "atscale.{cube_key}.jdbc.password={password}\n"
+        "atscale.{cube_key}.jdbc.maxPoolSize=10\n"
+        "atscale.{cube_key}.jdbc.log.resultset.rows=true\n"
+        "atscale.{cube_key}.xmla.auth.url=https://{host}:10500/default/auth\n"
+        "atscale.{cube_key}.xmla.url=https://{host}:10502/xmla/default/{token}\n"
+        "atscale.{cube_key}.xmla.cube={cube}\n"
+        "atscale.{cube_key}.xmla.catalog={catalog}\n"
+        "atscale.{cube_key}.xmla.log.responsebody=true\n"
+        "atscale.{cube_key}.xmla.auth.username={username}\n"
+        "atscale.{cube_key}.xmla.auth.password={password}\n"
+        "# \n"
+    )
+    
+    # Rotated <executor>.log.<mtime> files kept per executor
+    LOG_GENERATIONS = 5
+    
+    # Parsed config.json per path, reused until the file's mtime changes
+    _config_cache = {}
+    
+    @classmethod
+    def _load_config(cls, config_path):
+        """Parse config.json once per process (orjson when installed)"""
+        mtime = os.path.getmtime(config_path)
+        cached = cls._config_cache.get(config_path)
+        if cached is None or cached[0] != mtime:
+            with open(config_path, "rb") as f:
+                cached = (mtime, _json.loads(f.read()))
+            cls._config_cache[config_path] = cached
+        return dict(cached[1])
+        
+    @classmethod
+    def _ensure_layout(cls, *dirs):
+        """Create the working directories; later instances skip the syscalls"""
+        if cls._layout_done:
+            return
+        for d in dirs:
+            os.makedirs(d, exist_ok=True)
+        cls._layout_done = True
+        
     def __init__(self, config_path="config.json"):
-        with open(config_path) as f:
-            self.cfg = json.load(f)
+        self.cfg = self._load_config(config_path)
             
         self.working_dir = "working_dir"
         self.control_dir = os.path.join(self.working_dir, "control")
@@ -29,13 +129,13 @@ class AtScaleGatlingCore:
         self.config_dir = os.path.join(self.working_dir, "config")
         self.ingest_dir = os.path.join(self.working_dir, "ingest")
         
-        # Create directories if they don't exist
-        os.makedirs(self.control_dir, exist_ok=True)
-        os.makedirs(self.run_logs_dir, exist_ok=True)
-        os.makedirs(self.config_dir, exist_ok=True)
-        os.makedirs(self.ingest_dir, exist_ok=True)
+        # Create directories if they don't exist (once per process)
+        self._ensure_layout(self.control_dir, self.run_logs_dir, self.config_dir, self.ingest_dir)
         
         self.DOCKER_IMAGE = "rwidjaja/atscale-gatling:latest"
+        self.verbose = self.cfg.get("verbose", False)
+        self._image_verified = False
+        self._last_props_sig = None
         
         # Simulation executors
         self.executors = [
@@ -54,6 +154,13 @@ class AtScaleGatlingCore:
         self.is_running = False
         self.current_executor = None
         self.catalog_cube_pairs = []
+        
+        # One pooled keep-alive session shared by every XMLA call (and discovery threads)
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+        self._session.auth = (self.cfg["username"], self.cfg["password"])
+        self._session.verify = False
+        self._session.headers.update({"Content-Type": "text/xml"})
 
     def discover_and_setup(self):
         """Discover catalogs/cubes"""
@@ -65,11 +172,24 @@ class AtScaleGatlingCore:
                 print("❌ No catalogs found")
                 return False
                 
-            pairs = []
-            for cat in catalogs:
-                cubes = self.discover_cubes(cat)
-                for cube in cubes:
-                    pairs.append(f"{cat} :: {cube}")
+            # One unrestricted MDSCHEMA_CUBES query usually covers every catalog
+            try:
+                pairs = self.discover_all_cubes()
+            except Exception as e:
+                print(f"⚠️  Single-query discovery failed ({e}), querying catalogs one by one")
+                pairs = []
+                
+            # Fall back to per-catalog queries for anything the combined query did not return
+            covered = {pair.split(" :: ", 1)[0] for pair in pairs}
+            remaining = [cat for cat in catalogs if cat not in covered]
+            if remaining:
+                # Cube queries are independent round-trips, so run them concurrently
+                with ThreadPoolExecutor(max_workers=min(16, len(remaining))) as ex:
+                    results = list(ex.map(lambda c: (c, self.discover_cubes(c)), remaining))
+                    
+                for cat, cubes in results:
+                    for cube in cubes:
+                        pairs.append(f"{cat} :: {cube}")
                     
             self.catalog_cube_pairs = pairs
             print(f"✅ Discovery complete: {len(pairs)} catalog/cube pairs")
@@ -79,6 +199,11 @@ class AtScaleGatlingCore:
             print(f"❌ Discovery failed: {e}")
             return False
 
+    def discover_all_cubes(self):
+        """Discover catalog/cube pairs for all catalogs with a single XMLA query"""
+        with self.run_xmla_query(ALL_CUBES_QUERY, stream=True) as resp:
+            return self.parse_catalog_cube_rows(resp.raw)
+            
     def discover_catalogs(self):
         """Discover catalogs using XMLA"""
         CATALOG_QUERY = """<?xml version="1.0" encoding="utf-8"?>
@@ -128,103 +253,135 @@ class AtScaleGatlingCore:
           </soap:Body>
         </soap:Envelope>"""
         
-        xml_response = self.run_xmla_query(CUBE_QUERY)
-        return self.parse_cubes(xml_response)
+        with self.run_xmla_query(CUBE_QUERY, stream=True) as resp:
+            return self.parse_cubes(resp.raw)
         
-    def run_xmla_query(self, xml_body):
-        """Run XMLA query"""
+    def run_xmla_query(self, xml_body, stream=False):
+        """Run XMLA query; with stream=True the open response is returned for incremental parsing"""
         url = f"https://{self.cfg['host']}:10502/xmla/default"
-        resp = requests.post(
+        if isinstance(xml_body, str):
+            xml_body = xml_body.encode("utf-8")
+        resp = self._session.post(
             url,
-            data=xml_body.encode("utf-8"),
-            headers={"Content-Type": "text/xml"},
-            auth=(self.cfg["username"], self.cfg["password"]),
-            verify=False
+            data=xml_body,
+            timeout=(5, 60),
+            stream=stream
         )
         resp.raise_for_status()
-        return resp.text
+        if stream:
+            resp.raw.decode_content = True
+            return resp
+        return resp.content
         
-    def parse_catalogs(self, xml_text):
+    def parse_catalogs(self, xml_bytes):
         """Parse catalogs from XML response"""
-        root = ET.fromstring(xml_text)
-        return [el.text for el in root.findall(".//{urn:schemas-microsoft-com:xml-analysis:rowset}CATALOG_NAME")]
-        
-    def parse_cubes(self, xml_text):
-        """Parse cubes from XML response"""
-        root = ET.fromstring(xml_text)
-        return [el.text for el in root.findall(".//{urn:schemas-microsoft-com:xml-analysis:rowset}CUBE_NAME")]
+        root = etree.fromstring(xml_bytes)
+        if CATALOG_XPATH is not None:
+            return [str(text) for text in CATALOG_XPATH(root)]
+        return [el.text for el in root.findall(CATALOG_PATH)]
+        
+    def parse_cubes(self, source):
+        """Parse cubes from an XML response stream (or bytes) as it arrives"""
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+        cubes = []
+        for _, el in etree.iterparse(source, events=("end",)):
+            if el.tag == CUBE_TAG:
+                cubes.append(el.text)
+                el.clear()
+        return cubes
+        
+    def parse_catalog_cube_rows(self, source):
+        """Parse "catalog :: cube" pairs from a rowset carrying both columns"""
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+        pairs = []
+        for _, el in etree.iterparse(source, events=("end",)):
+            if el.tag == ROW_TAG:
+                catalog = el.findtext(CATALOG_TAG)
+                cube = el.findtext(CUBE_TAG)
+                if catalog and cube:
+                    pairs.append(f"{catalog} :: {cube}")
+                el.clear()
+        return pairs
         
     def write_systems_properties(self, selected_pairs):
         """Write systems.properties file with selected catalog/cube pairs"""
         if not selected_pairs:
             raise ValueError("No catalog/cube pairs selected")
             
-        cubes = [pair.split("::")[1].strip() for pair in selected_pairs]
-        catalogs = [pair.split("::")[0].strip() for pair in selected_pairs]
-
         filepath = os.path.join(self.config_dir, "systems.properties")
+        
+        # Same pairs and same config as the last write means the file on disk is already current
+        sig = hashlib.blake2b(repr((sorted(selected_pairs), sorted(self.cfg.items()))).encode()).digest()
+        if sig == self._last_props_sig and os.path.exists(filepath):
+            print("✅ systems.properties unchanged, skipping rewrite")
+            return
+            
+        # (catalog, cube, cube_key, catalog_jdbc) per pair, split and escaped once
+        parsed = [
+            (catalog, cube, cube.replace(" ", "_"), catalog.replace(" ", "%20"))
+            for catalog, cube in (
+                [p.strip() for p in pair.split("::", 1)] for pair in selected_pairs
+            )
+        ]
 
-        with open(filepath, "w") as f:
-            f.write("atscale.schema.type=installer\n")
-            f.write("atscale.models=" + ", ".join(catalogs) + "\n")
+        parts = []
+        parts.append("atscale.schema.type=installer\n")
+        parts.append("atscale.models=" + ", ".join(entry[0] for entry in parsed) + "\n")
 
-            for pair in selected_pairs:
-                catalog, cube = [p.strip() for p in pair.split("::")]
-                cube_key = cube.replace(" ", "_")
-                catalog_jdbc_name = catalog.replace(" ", "%20")
+        pair_values = {
+            "host": self.cfg["host"], "token": self.cfg["token"],
+            "username": self.cfg["username"], "password": self.cfg["password"],
+        }
+        for catalog, cube, cube_key, catalog_jdbc_name in parsed:
+            parts.append(self._PAIR_TEMPLATE.format_map(dict(
+                pair_values, cube_key=cube_key, cube=cube,
+                catalog=catalog, catalog_jdbc=catalog_jdbc_name
+            )))
 
-                f.write(f"atscale.{cube_key}.jdbc.url=jdbc:postgresql://{self.cfg['host']}:15432/{catalog_jdbc_name}\n")
-                f.write(f"atscale.{cube_key}.jdbc.username={self.cfg['username']}\n")
-                f.write(f"atscale.{cube_key}.jdbc.password={self.cfg['password']}\n")
-                f.write(f"atscale.{cube_key}.jdbc.maxPoolSize=10\n")
-                f.write(f"atscale.{cube_key}.jdbc.log.resultset.rows=true\n")
-                f.write(f"atscale.{cube_key}.xmla.auth.url=https://{self.cfg['host']}:10500/default/auth\n")
-                f.write(f"atscale.{cube_key}.xmla.url=https://{self.cfg['host']}:10502/xmla/default/{self.cfg['token']}\n")
-                f.write(f"atscale.{cube_key}.xmla.cube={cube}\n")
-                f.write(f"atscale.{cube_key}.xmla.catalog={catalog}\n")
-                f.write(f"atscale.{cube_key}.xmla.log.responsebody=true\n")
-                f.write(f"atscale.{cube_key}.xmla.auth.username={self.cfg['username']}\n")
-                f.write(f"atscale.{cube_key}.xmla.auth.password={self.cfg['password']}\n")
-                f.write("# \n")
+        parts.append(f"atscale.postgres.jdbc.url=jdbc:postgresql://{self.cfg['postgres_host']}:10520/atscale\n")
+        parts.append("atscale.postgres.jdbc.username=atscale\n")
+        parts.append("atscale.postgres.jdbc.password=atscale\n")
+        parts.append("#System Parameter\n")
+        parts.append("atscale.gatling.throttle.ms=5\n")
+        parts.append("atscale.xmla.maxConnectionsPerHost=20\n")
+        parts.append("atscale.xmla.useAggregates=true\n")
+        parts.append("atscale.xmla.generateAggregates=false\n")
+        parts.append("atscale.xmla.useQueryCache=false\n")
+        parts.append("atscale.xmla.useAggregateCache=true\n")
+        parts.append("atscale.jdbc.useAggregates=true\n")
+        parts.append("atscale.jdbc.generateAggregates=false\n")
+        parts.append("atscale.jdbc.useLocalCache=false\n")
+        
+        # Add AWS config if present
+        if self.cfg.get("aws.region"):
+            parts.append(f"aws.region={self.cfg['aws.region']}\n")
+        if self.cfg.get("aws.secrets-key"):
+            parts.append(f"aws.secrets-key={self.cfg['aws.secrets-key']}\n")
+            
+        # Add Snowflake config if present
+        if self.cfg.get("snowflake.archive.account"):
+            parts.append(f"snowflake.archive.account={self.cfg['snowflake.archive.account']}\n")
+        if self.cfg.get("snowflake.archive.warehouse"):
+            parts.append(f"snowflake.archive.warehouse={self.cfg['snowflake.archive.warehouse']}\n")
+        if self.cfg.get("snowflake.archive.database"):
+            parts.append(f"snowflake.archive.database={self.cfg['snowflake.archive.database']}\n")
+        if self.cfg.get("snowflake.archive.schema"):
+            parts.append(f"snowflake.archive.schema={self.cfg['snowflake.archive.schema']}\n")
+        if self.cfg.get("snowflake.archive.role"):
+            parts.append(f"snowflake.archive.role={self.cfg['snowflake.archive.role']}\n")
+        if self.cfg.get("snowflake.archive.username"):
+            parts.append(f"snowflake.archive.username={self.cfg['snowflake.archive.username']}\n")
+        if self.cfg.get("snowflake.archive.password"):
+            parts.append(f"snowflake.archive.password={self.cfg['snowflake.archive.token']}\n")
+        if self.cfg.get("snowflake.archive.token"):
+            parts.append(f"snowflake.archive.token={self.cfg['snowflake.archive.token']}\n")
+
+        with open(filepath, "w", buffering=1 << 16) as f:
+            f.write("".join(parts))
+        self._last_props_sig = sig
 
-            f.write(f"atscale.postgres.jdbc.url=jdbc:postgresql://{self.cfg['postgres_host']}:10520/atscale\n")
-            f.write("atscale.postgres.jdbc.username=atscale\n")
-            f.write("atscale.postgres.jdbc.password=atscale\n")
-            f.write("#System Parameter\n")
-            f.write("atscale.gatling.throttle.ms=5\n")
-            f.write("atscale.xmla.maxConnectionsPerHost=20\n")
-            f.write("atscale.xmla.useAggregates=true\n")
-            f.write("atscale.xmla.generateAggregates=false\n")
-            f.write("atscale.xmla.useQueryCache=false\n")
-            f.write("atscale.xmla.useAggregateCache=true\n")
-            f.write("atscale.jdbc.useAggregates=true\n")
-            f.write("atscale.jdbc.generateAggregates=false\n")
-            f.write("atscale.jdbc.useLocalCache=false\n")
-            
-            # Add AWS config if present
-            if self.cfg.get("aws.region"):
-                f.write(f"aws.region={self.cfg['aws.region']}\n")
-            if self.cfg.get("aws.secrets-key"):
-                f.write(f"aws.secrets-key={self.cfg['aws.secrets-key']}\n")
-                
-            # Add Snowflake config if present
-            if self.cfg.get("snowflake.archive.account"):
-                f.write(f"snowflake.archive.account={self.cfg['snowflake.archive.account']}\n")
-            if self.cfg.get("snowflake.archive.warehouse"):
-                f.write(f"snowflake.archive.warehouse={self.cfg['snowflake.archive.warehouse']}\n")
-            if self.cfg.get("snowflake.archive.database"):
-                f.write(f"snowflake.archive.database={self.cfg['snowflake.archive.database']}\n")
-            if self.cfg.get("snowflake.archive.schema"):
-                f.write(f"snowflake.archive.schema={self.cfg['snowflake.archive.schema']}\n")
-            if self.cfg.get("snowflake.archive.role"):
-                f.write(f"snowflake.archive.role={self.cfg['snowflake.archive.role']}\n")
-            if self.cfg.get("snowflake.archive.username"):
-                f.write(f"snowflake.archive.username={self.cfg['snowflake.archive.username']}\n")
-            if self.cfg.get("snowflake.archive.password"):
-                f.write(f"snowflake.archive.password={self.cfg['snowflake.archive.token']}\n")
-            if self.cfg.get("snowflake.archive.token"):
-                f.write(f"snowflake.archive.token={self.cfg['snowflake.archive.token']}\n")
-                
         print(f"✅ systems.properties regenerated with {len(selected_pairs)} selected pairs")
             
     def build_docker_command(self, executor_name):
@@ -257,19 +414,47 @@ class AtScaleGatlingCore:
         return cmd
         
     def ensure_docker_image(self):
-        """Check and pull Docker image if needed"""
+        """Check and pull Docker image if needed (a positive result is kept until restart)"""
+        if self._image_verified:
+            return True
+            
         try:
             result = subprocess.run(["docker", "image", "inspect", self.DOCKER_IMAGE], 
-                                  capture_output=True)
-            if result.returncode == 0:
-                return True
-                
-            print("Pulling Docker image...")
-            result = subprocess.run(["docker", "pull", self.DOCKER_IMAGE])
-            return result.returncode == 0
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if result.returncode != 0:
+                print("Pulling Docker image...")
+                result = subprocess.run(["docker", "pull", self.DOCKER_IMAGE])
+            self._image_verified = result.returncode == 0
+            return self._image_verified
         except:
             return False
             
+    def _rotate_log(self, log_file):
+        """Move a non-empty log to <log>.<mtime>[-n] and prune to LOG_GENERATIONS"""
+        try:
+            st = os.stat(log_file)
+        except FileNotFoundError:
+            return
+        if st.st_size == 0:
+            return
+        
+        # Two runs in the same second get -1, -2, ... instead of overwriting
+        rotated = f"{log_file}.{int(st.st_mtime)}"
+        n = 0
+        while os.path.exists(rotated if not n else f"{rotated}-{n}"):
+            n += 1
+        os.replace(log_file, rotated if not n else f"{rotated}-{n}")
+        
+        prefix = os.path.basename(log_file) + "."
+        with os.scandir(os.path.dirname(log_file) or ".") as it:
+            old = sorted((e for e in it if e.name.startswith(prefix) and e.is_file()),
+                         key=lambda e: (e.stat().st_mtime_ns, e.name), reverse=True)
+        for entry in old[self.LOG_GENERATIONS:]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+        
     def run_executor(self, executor_name, selected_pairs, follow_logs=False):
         """Run an executor with selected catalog/cube pairs"""
         if self.is_running:
@@ -293,10 +478,17 @@ class AtScaleGatlingCore:
             cmd = self.build_docker_command(executor_name)
             
             print(f"🐳 Running {executor_name} with {len(selected_pairs)} selected models...")
-            print(f"Command: {' '.join(cmd)}")
+            if self.verbose:
+                print(f"Command: {' '.join(shlex.quote(c) for c in cmd)}")
             
-            with open(log_file, "w") as f:
-                self.current_process = subprocess.Popen(cmd, stdout=f, stderr=subprocess.STDOUT)
+            # Keep the previous run's log under a timestamp suffix; the child appends
+            # straight to the fd, so the parent adds no buffering of its own
+            self._rotate_log(log_file)
+            fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                self.current_process = subprocess.Popen(cmd, stdout=fd, stderr=subprocess.STDOUT)
+            finally:
+                os.close(fd)
                 
             if follow_logs:
                 # Tail logs in real-time for CLI
@@ -330,6 +522,7 @@ class AtScaleGatlingCore:
         print(f"Log file: {log_file}")
         print("Press Ctrl+C to stop tailing (executor will continue running)\n")
         
+        tail_process = None
         try:
             # Use tail -f to follow logs
             tail_process = subprocess.Popen(['tail', '-f', log_file], 
@@ -337,13 +530,17 @@ class AtScaleGatlingCore:
                                           stderr=subprocess.PIPE,
                                           text=True)
             
-            while self.current_process.poll() is None and tail_process.poll() is None:
-                line = tail_process.stdout.readline()
-                if line:
+            # Blocking reads in a helper thread print each line as soon as tail emits it
+            def pump():
+                for line in iter(tail_process.stdout.readline, ''):
                     print(line, end='', flush=True)
-                time.sleep(0.1)
-                
+                    
+            reader = threading.Thread(target=pump, daemon=True)
+            reader.start()
+            
+            self.current_process.wait()
             tail_process.terminate()
+            reader.join(timeout=1)
             
         except KeyboardInterrupt:
             print("\n⏹️  Stopped tailing logs (executor continues running)")
@@ -381,18 +578,24 @@ class AtScaleGatlingGUI:
     """GUI version - Left: Model selection, Right: Executor selection"""
     
     def __init__(self, root):
+        load_tk()
         self.root = root
         self.root.title("AtScale Gatling Controller")
         self.root.geometry("1200x800")
         
         self.core = AtScaleGatlingCore()
-        self.log_queue = queue.Queue()
+        self._log_line_count = 0
         self.tail_process = None
         self.current_executor = None
         self.is_running = False
         
         self.setup_gui()
-        self.start_log_monitor()
+        
+        # Hold log lines while the window is minimized and flush them when it is restored
+        self._ui_visible = True
+        self._pending_logs = deque(maxlen=1000)
+        self.root.bind("<Unmap>", self.on_unmap)
+        self.root.bind("<Map>", self.on_map)
         
         # Start discovery in background
         threading.Thread(target=self.discover_and_setup_gui, daemon=True).start()
@@ -480,9 +683,8 @@ class AtScaleGatlingGUI:
         self.executor_listbox.config(yscrollcommand=scrollbar.set)
         scrollbar.config(command=self.executor_listbox.yview)
         
-        # Populate executors
-        for executor in self.core.executors:
-            self.executor_listbox.insert(tk.END, executor)
+        # Populate executors (one Tcl call for the whole list)
+        self.executor_listbox.insert(tk.END, *self.core.executors)
         
         # Control buttons frame
         button_frame = tk.Frame(frame)
@@ -521,6 +723,11 @@ class AtScaleGatlingGUI:
                  command=self.cancel_stop_signal,
                  bg='#9E9E9E', fg='black', font=('Arial', 9)).pack(side=tk.LEFT, padx=2)
         
+        # Transient, non-modal acknowledgement for the stop controls
+        self.notice_label = tk.Label(stop_frame, text="", font=('Arial', 9), fg='#E65100')
+        self.notice_label.pack(anchor=tk.W)
+        self._notice_after_id = None
+        
         # Status
         self.status_label = tk.Label(frame, text="Status: Ready", relief=tk.SUNKEN, bd=1, 
                                    font=('Arial', 10), bg='#E8F5E8')
@@ -558,8 +765,8 @@ class AtScaleGatlingGUI:
     def update_model_list(self):
         """Update the model listbox with discovered catalog/cube pairs"""
         self.model_listbox.delete(0, tk.END)
-        for pair in self.core.catalog_cube_pairs:
-            self.model_listbox.insert(tk.END, pair)
+        if self.core.catalog_cube_pairs:
+            self.model_listbox.insert(tk.END, *self.core.catalog_cube_pairs)
         
     def select_all_models(self):
         """Select all models in the list"""
@@ -688,26 +895,53 @@ class AtScaleGatlingGUI:
             
         # Use system tail -F command for efficient tailing
         def tail_with_system_command():
+            proc = None
             try:
-                self.tail_process = subprocess.Popen(
+                proc = self.tail_process = subprocess.Popen(
                     ['tail', '-F', log_file],
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
-                    universal_newlines=True
+                    bufsize=0
                 )
                 
-                while self.tail_process and self.tail_process.poll() is None and self.is_running:
-                    line = self.tail_process.stdout.readline()
-                    if line:
-                        self.log_queue.put(line.strip())
-                    time.sleep(0.01)
+                # Wait on stdout and stderr together; each ready pipe is drained with one
+                # os.read of up to 64 KiB, which is already a natural batch. A trailing
+                # partial line is held per pipe until its newline arrives. The 1 s
+                # timeout only exists so a stopped run is noticed while tail is quiet;
+                # stop_tail_logs() terminates tail, which closes both pipes (EOF).
+                def flush(lines):
+                    text = "".join(line.decode("utf-8", errors="replace").strip() + "\n"
+                                   for line in lines)
+                    self.root.after(0, self.append_log_batch, text)
+                
+                with selectors.DefaultSelector() as sel:
+                    sel.register(proc.stdout, selectors.EVENT_READ, b"")
+                    sel.register(proc.stderr, selectors.EVENT_READ, b"")
+                    while sel.get_map() and self.is_running:
+                        for key, _ in sel.select(timeout=1.0):
+                            chunk = os.read(key.fd, 65536)
+                            if not chunk:
+                                # EOF: emit the unterminated last line before dropping the pipe
+                                if key.data:
+                                    flush([key.data])
+                                sel.unregister(key.fileobj)
+                                continue
+                            *complete, rest = (key.data + chunk).split(b"\n")
+                            sel.modify(key.fileobj, selectors.EVENT_READ, rest)
+                            if complete:
+                                flush(complete)
+                    # Stopped while pipes were still open: keep their partial lines
+                    for key in list(sel.get_map().values()):
+                        if key.data:
+                            flush([key.data])
                         
             except Exception as e:
-                self.log_queue.put(f"Tail error: {e}")
+                self.root.after(0, self.append_log, f"Tail error: {e}")
             finally:
-                if self.tail_process:
-                    self.tail_process.terminate()
-                    self.tail_process = None
+                if proc:
+                    proc.terminate()
+                    if self.tail_process is proc:
+                        self.tail_process = None
                 
         threading.Thread(target=tail_with_system_command, daemon=True).start()
         
@@ -721,49 +955,83 @@ class AtScaleGatlingGUI:
         """Create stop_simulation file"""
         if self.core.stop_simulation():
             self.log_activity("🛑 GLOBAL STOP SIGNAL SENT to all simulations")
-            messagebox.showinfo("Stop Signal", "Stop signal sent to all running simulations!")
+            self.show_notice("🛑 Stop signal sent to all running simulations")
         else:
-            messagebox.showerror("Error", "Failed to create stop signal")
+            self.show_notice("❌ Failed to create stop signal")
             
     def cancel_stop_signal(self):
         """Remove stop_simulation file"""
         if self.core.cancel_stop_signal():
             self.log_activity("✅ Global stop signal cancelled")
         else:
-            messagebox.showerror("Error", "Failed to cancel stop signal")
+            self.show_notice("❌ Failed to cancel stop signal")
+            
+    def show_notice(self, text, duration_ms=3000):
+        """Show a short message under the stop controls without blocking the event loop"""
+        if self._notice_after_id is not None:
+            self.root.after_cancel(self._notice_after_id)
+        self.notice_label.config(text=text)
+        self._notice_after_id = self.root.after(duration_ms, self.clear_notice)
+        
+    def clear_notice(self):
+        """Clear the transient notice"""
+        self._notice_after_id = None
+        self.notice_label.config(text="")
             
-    def start_log_monitor(self):
-        """Monitor log queue and update display"""
-        def check_queue():
-            try:
-                while True:
-                    line = self.log_queue.get_nowait()
-                    self.append_log(line)
-            except queue.Empty:
-                pass
-            finally:
-                self.root.after(100, check_queue)
-                
-        self.root.after(100, check_queue)
-        
     def append_log(self, line):
         """Append line to log display"""
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, line + '\n')
+        self.append_log_batch(line + '\n')
         
-        # Limit log size to prevent memory issues (keep last 1000 lines)
-        lines = int(self.log_text.index('end-1c').split('.')[0])
-        if lines > 1000:
-            self.log_text.delete(1.0, f"{lines-1000}.0")
+    def append_log_batch(self, text):
+        """Append newline-terminated text to the log display with one insert"""
+        # While minimized, just keep the newest lines and skip Tk entirely
+        if not self._ui_visible:
+            self._pending_logs.extend(text.splitlines(keepends=True))
+            return
+            
+        # Unmap the widget for large bursts so Tk lays out and redraws once, not per line
+        added = text.count('\n')
+        bulk = added > 50
+        if bulk:
+            self.log_text.pack_forget()
+            
+        self.log_text.config(state=tk.NORMAL)
+        self.log_text.insert(tk.END, text)
+        
+        # Limit log size to prevent memory issues (keep last 1000 lines);
+        # the line count is tracked here rather than asked of Tk
+        self._log_line_count += added
+        if self._log_line_count > 1000:
+            excess = self._log_line_count - 1000
+            self.log_text.delete(1.0, f"{excess + 1}.0")
+            self._log_line_count -= excess
             
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
         
+        if bulk:
+            self.log_text.pack(fill=tk.BOTH, expand=True)
+        
+    def on_unmap(self, event):
+        """Window minimized/withdrawn: stop touching the log widget"""
+        if event.widget is self.root:
+            self._ui_visible = False
+            
+    def on_map(self, event):
+        """Window restored: insert everything that arrived while hidden in one go"""
+        if event.widget is self.root and not self._ui_visible:
+            self._ui_visible = True
+            if self._pending_logs:
+                pending = "".join(self._pending_logs)
+                self._pending_logs.clear()
+                self.append_log_batch(pending)
+                
     def clear_logs(self):
         """Clear log display"""
         self.log_text.config(state=tk.NORMAL)
         self.log_text.delete(1.0, tk.END)
         self.log_text.config(state=tk.DISABLED)
+        self._log_line_count = 0
         
     def log_activity(self, message):
         """Log activity message"""
@@ -777,6 +1045,27 @@ class AtScaleGatlingGUI:
             self.core.current_process.terminate()
         self.root.destroy()
 
+def _model_key(text):
+    """Normalise "Catalog :: Cube" / "Catalog::Cube" spellings for lookup"""
+    return "::".join(part.strip() for part in text.split("::", 1))
+
+def build_model_index(pairs):
+    """Index discovered pairs by full name and by cube name (first discovered pair wins)"""
+    index = {"pair": {}, "cube": {}}
+    for pair in pairs:
+        cube = pair.split("::", 1)[1].strip()
+        index["pair"].setdefault(_model_key(pair), pair)
+        index["cube"].setdefault(cube, pair)
+    return index
+
+def resolve_model(model, index, pairs):
+    """Return the pairs a --models entry refers to: exact pair, then cube name, then substring"""
+    match = index["pair"].get(_model_key(model)) or index["cube"].get(model)
+    if match:
+        return [match]
+    # Only the substring fallback can be ambiguous; the caller rejects multiple hits
+    return [pair for pair in pairs if model in pair]
+
 def run_cli_mode(args):
     """Run in CLI mode with command line arguments"""
     core = AtScaleGatlingCore()
@@ -800,18 +1089,17 @@ def run_cli_mode(args):
     if args.models:
         # Use specified models
         specified_models = args.models.split(',')
+        model_index = build_model_index(core.catalog_cube_pairs)
         for model in specified_models:
             model = model.strip()
-            # Try to find matching catalog::cube pair
-            found = False
-            for pair in core.catalog_cube_pairs:
-                if model in pair:
-                    selected_models.append(pair)
-                    found = True
-                    break
-            if not found:
+            matches = resolve_model(model, model_index, core.catalog_cube_pairs)
+            if not matches:
                 print(f"❌ Model '{model}' not found in discovered pairs")
                 return 1
+            if len(matches) > 1:
+                print(f"❌ Model '{model}' is ambiguous, matches: {', '.join(matches)}")
+                return 1
+            selected_models.append(matches[0])
     elif args.all_models:
         # Use all models
         selected_models = core.catalog_cube_pairs
@@ -889,6 +1177,7 @@ def run_gui_mode():
         print("Use the CLI version or run on a system with graphical display.")
         return 1
         
+    load_tk()
     root = tk.Tk()
     app = AtScaleGatlingGUI(root)
     root.protocol("WM_DELETE_WINDOW", app.on_closing)
@@ -8,18 +8,36 @@ etc., while the actual implementation remains in the existing modules
 
 """AtScale Gatling Wrapper Package"""
 
-# Expose submodules
-from . import cli
-from . import gui
-from . import core
-from . import config
-
-# Expose key classes/functions at top level
-from .core import AtScaleGatlingCore
-from .gui import AtScaleGatlingGUI
-from .cli import run_cli_mode, create_cli_parser
-from .config import ConfigManager, Constants
-from .csv_handler import CSVConfigWindow
+import importlib
+
+# Submodules and top-level names are imported on first access (PEP 562), so
+# CLI-only use never pulls in tkinter or the GUI modules.
+_SUBMODULES = {"cli", "gui", "core", "config", "csv_handler"}
+_LAZY_ATTRS = {
+    "AtScaleGatlingCore": "core",
+    "AtScaleGatlingGUI": "gui",
+    "run_cli_mode": "cli",
+    "create_cli_parser": "cli",
+    "ConfigManager": "config",
+    "Constants": "config",
+    "CSVConfigWindow": "csv_handler",
+}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES | set(_LAZY_ATTRS))
+
 
 __all__ = [
     "cli",
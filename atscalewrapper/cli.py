@@ -4,34 +4,48 @@ Provides `create_cli_parser()` and `run_cli_mode(args)` to match
 what the top-level `main.py` expects.
 """
 import argparse
-from .core import AtScaleGatlingCore
+import re
+import sys
+from bisect import bisect_right
+from functools import lru_cache
 
+from .config import Constants
 
-def create_cli_parser():
-    """Return an ArgumentParser that parses CLI-specific options.
+_NUM_RE = re.compile(r"\d+")
 
-    This parser purposely excludes a `--mode` option because the
-    top-level launcher handles that.
-    """
-    parser = argparse.ArgumentParser(add_help=False)
-    parser.add_argument('--executor', help='Executor to run (required for CLI mode)')
-    parser.add_argument('--models', help='Comma-separated list of models to run')
-    parser.add_argument('--all-models', action='store_true', help='Run with all discovered models')
-    parser.add_argument('--follow', action='store_true', help='Follow logs in real-time')
-    return parser
 
+def _build_pair_index(pairs):
+    """Index catalog/cube pairs for exact lookup and one-pass substring search"""
+    exact = set(pairs)
+    haystack = "\n".join(pairs)
+    starts = []
+    offset = 0
+    for pair in pairs:
+        starts.append(offset)
+        offset += len(pair) + 1
+    return exact, haystack, starts
+
+
+def _match_pairs(model, pairs, index):
+    """Return [exact pair] if `model` is one, else every pair containing it"""
+    exact, haystack, starts = index
+    if model in exact:
+        return [model]
+    if "\n" in model or not model:
+        return []
+    matches = []
+    pos = haystack.find(model)
+    while pos >= 0:
+        i = bisect_right(starts, pos) - 1
+        matches.append(pairs[i])
+        # Resume at the next pair; one hit per pair is enough
+        pos = haystack.find(model, starts[i + 1]) if i + 1 < len(starts) else -1
+    return matches
 
-def run_cli_mode(args):
-    """Create core and run the underlying CLI implementation."""
-    core = AtScaleGatlingCore()
-    return _run_cli_mode(args, core)
-"""CLI mode functionality"""
-import argparse
-import sys
-from atscalewrapper.core import AtScaleGatlingCore
 
 def run_cli_mode(args):
     """Run in CLI mode with command line arguments"""
+    from .core import AtScaleGatlingCore
     core = AtScaleGatlingCore()
     
     print("🚀 AtScale Gatling CLI Mode")
@@ -52,35 +66,38 @@ def run_cli_mode(args):
     
     if args.models:
         # Use specified models
-        specified_models = args.models.split(',')
+        specified_models = [m.strip() for m in args.models.split(',')]
+        index = _build_pair_index(core.catalog_cube_pairs)
         for model in specified_models:
-            model = model.strip()
-            # Try to find matching catalog::cube pair
-            found = False
-            for pair in core.catalog_cube_pairs:
-                if model in pair:
-                    selected_models.append(pair)
-                    found = True
-                    break
-            if not found:
+            # Exact catalog::cube first, then the single pair containing it
+            matches = _match_pairs(model, core.catalog_cube_pairs, index)
+            if not matches:
                 print(f"❌ Model '{model}' not found in discovered pairs")
                 return 1
+            if len(matches) > 1:
+                print(f"❌ Model '{model}' is ambiguous, matches: {', '.join(matches)}")
+                return 1
+            selected_models.append(matches[0])
     elif args.all_models:
         # Use all models
         selected_models = core.catalog_cube_pairs
     else:
         # Interactive selection
-        print("\nAvailable catalog/cube pairs:")
-        for i, pair in enumerate(core.catalog_cube_pairs, 1):
-            print(f"  {i}. {pair}")
+        n_pairs = len(core.catalog_cube_pairs)
+        _write_list("\nAvailable catalog/cube pairs:", core.catalog_cube_pairs)
         
         try:
-            selection = input(f"\nSelect models (comma-separated numbers 1-{len(core.catalog_cube_pairs)}, or 'all'): ").strip()
+            selection = input(f"\nSelect models (comma-separated numbers 1-{n_pairs}, or 'all'): ").strip()
             if selection.lower() == 'all':
                 selected_models = core.catalog_cube_pairs
             else:
-                indices = [int(x.strip()) - 1 for x in selection.split(',')]
-                selected_models = [core.catalog_cube_pairs[i] for i in indices if 0 <= i < len(core.catalog_cube_pairs)]
+                tokens = [t.strip() for t in selection.split(',')]
+                if not all(_NUM_RE.fullmatch(t) for t in tokens):
+                    raise ValueError(selection)
+                indices = [int(t) - 1 for t in tokens]
+                if not all(0 <= i < n_pairs for i in indices):
+                    raise ValueError(selection)
+                selected_models = [core.catalog_cube_pairs[i] for i in indices]
         except (ValueError, IndexError):
             print("❌ Invalid selection")
             return 1
@@ -89,22 +106,18 @@ def run_cli_mode(args):
         print("❌ No models selected")
         return 1
     
-    print(f"\n✅ Selected {len(selected_models)} models:")
-    for model in selected_models:
-        print(f"  - {model}")
+    _write_list(f"\n✅ Selected {len(selected_models)} models:", selected_models, "  - {1}")
     
     # Handle executor selection
     if args.executor:
         executor = args.executor
-        if executor not in core.executors:
+        if executor not in Constants.EXECUTORS_SET:
             print(f"❌ Executor '{executor}' not found")
             print(f"Available executors: {', '.join(core.executors)}")
             return 1
     else:
         # Interactive executor selection
-        print("\nAvailable executors:")
-        for i, executor in enumerate(core.executors, 1):
-            print(f"  {i}. {executor}")
+        _write_list("\nAvailable executors:", core.executors)
         
         try:
             selection = int(input(f"\nSelect executor (1-{len(core.executors)}): ")) - 1
@@ -134,8 +147,17 @@ def run_cli_mode(args):
         print(f"❌ Error: {e}")
         return 1
 
+def _write_list(header, items, fmt="  {0}. {1}"):
+    """Write a header and a numbered list to stdout in one write"""
+    lines = [header]
+    lines.extend(fmt.format(i, item) for i, item in enumerate(items, 1))
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+@lru_cache(maxsize=1)
 def create_cli_parser():
-    """Create CLI argument parser"""
+    """Create CLI argument parser (built once, reused by later callers)"""
     parser = argparse.ArgumentParser(description='AtScale Gatling Controller - CLI Mode')
     
     # CLI-specific arguments
@@ -144,4 +166,4 @@ def create_cli_parser():
     parser.add_argument('--all-models', action='store_true', help='Run with all discovered models')
     parser.add_argument('--follow', action='store_true', help='Follow logs in real-time')
     
-    return parser
\ No newline at end of file
+    return parser
@@ -1,6 +1,35 @@
 """Simple config helper for atscalewrapper."""
-import json
 import os
+from operator import itemgetter
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+# abspath -> (st_mtime_ns, st_size, parsed dict)
+_CACHE = {}
+
+REQUIRED_FIELDS = ("host", "username", "password", "token", "postgres_host")
+_required_values = itemgetter(*REQUIRED_FIELDS)
+
+_PKG_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
+
+
+def _read_json(path, st=None):
+    """Parse `path`, reusing the cached dict while the file is unchanged."""
+    path = os.path.abspath(path)
+    if st is None:
+        st = os.stat(path)
+    hit = _CACHE.get(path)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return dict(hit[2])
+    with open(path, "rb") as f:
+        data = _loads(f.read())
+    _CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return dict(data)
 
 
 def load_config(path=None):
@@ -9,16 +38,16 @@ def load_config(path=None):
     Returns a dict (may raise FileNotFoundError).
     """
     if path is None:
-        pkg_cfg = os.path.join(os.path.dirname(__file__), "config.json")
-        if os.path.exists(pkg_cfg):
-            path = pkg_cfg
-        elif os.path.exists("config.json"):
-            path = "config.json"
-        else:
-            raise FileNotFoundError("config.json not found")
+        # One stat per candidate; the winning stat also keys the cache
+        for candidate in (_PKG_CONFIG, "config.json"):
+            try:
+                st = os.stat(candidate)
+            except FileNotFoundError:
+                continue
+            return _read_json(candidate, st)
+        raise FileNotFoundError("config.json not found")
 
-    with open(path, "r") as f:
-        return json.load(f)
+    return _read_json(path)
 
 __all__ = ["load_config"]
 """Configuration and constants"""
@@ -54,13 +83,15 @@ class ConfigManager:
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
             
-        with open(config_path) as f:
-            config = json.load(f)
+        config = _read_json(config_path)
             
         # Validate required fields
-        required_fields = ["host", "username", "password", "token", "postgres_host"]
-        for field in required_fields:
-            if field not in config or not config[field]:
+        try:
+            values = _required_values(config)
+        except KeyError as e:
+            raise ValueError(f"Required field {e} is missing or empty in config.json") from None
+        for field, value in zip(REQUIRED_FIELDS, values):
+            if not value:
                 raise ValueError(f"Required field '{field}' is missing or empty in config.json")
                 
         return config
@@ -105,6 +136,7 @@ class Constants:
         "ArchiveJdbcToSnowflake",
         "ArchiveXmlaToSnowflake"
     ]
+    EXECUTORS_SET = frozenset(EXECUTORS)
     
     # Directory structure
     WORKING_DIR = "working_dir"
@@ -113,8 +145,8 @@ class Constants:
     CONFIG_DIR = "working_dir/config"
     INGEST_DIR = "working_dir/ingest"
     
-    # XMLA Queries
-    CATALOG_QUERY = """<?xml version="1.0" encoding="utf-8"?>
+    # XMLA Queries (bytes, indentation stripped, ready to POST as-is)
+    CATALOG_QUERY = b"\n".join(line.strip().encode("utf-8") for line in """<?xml version="1.0" encoding="utf-8"?>
     <soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"
                    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
                    xmlns:xsd="http://www.w3.org/2001/XMLSchema">
@@ -133,4 +165,4 @@ class Constants:
           </Properties>
         </Execute>
       </soap:Body>
-    </soap:Envelope>"""
\ No newline at end of file
+    </soap:Envelope>""".splitlines() if line.strip())
\ No newline at end of file
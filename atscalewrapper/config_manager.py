@@ -3,20 +3,40 @@ config_manager.py
 Handles configuration file management and certificate generation.
 """
 
-import json
+import importlib.util
 import os
-import subprocess
 from pathlib import Path
 from typing import Dict, Any, Optional
 
-# GUI availability
-GUI_AVAILABLE = False
+from .config import _CACHE, _read_json
+
 try:
-    import tkinter as tk
-    from tkinter import messagebox, simpledialog
-    GUI_AVAILABLE = True
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
 except ImportError:
-    pass
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+# GUI availability (tkinter itself is only imported when a dialog opens)
+GUI_AVAILABLE = importlib.util.find_spec("tkinter") is not None
+tk = messagebox = simpledialog = None
+
+
+def _ensure_tk() -> bool:
+    """Import tkinter on first use and bind the module-level names."""
+    global tk, messagebox, simpledialog
+    if tk is None:
+        try:
+            import tkinter
+            from tkinter import messagebox as _mb, simpledialog as _sd
+        except ImportError:
+            return False
+        tk, messagebox, simpledialog = tkinter, _mb, _sd
+    return True
 
 
 DEFAULT_CONFIG = {
@@ -41,6 +61,17 @@ DEFAULT_CONFIG = {
     "snowflake.archive.token": ""
 }
 
+_SENSITIVE_TOKENS = ("password", "token", "secret")
+
+
+def _is_sensitive(key: str) -> bool:
+    lowered = key.lower()
+    return any(t in lowered for t in _SENSITIVE_TOKENS)
+
+
+# (key, masked) for every DEFAULT_CONFIG field, in prompt order
+_FIELDS = tuple((key, _is_sensitive(key)) for key in DEFAULT_CONFIG)
+
 
 class ConfigManager:
     def __init__(self, config_path: str = "config.json"):
@@ -53,132 +84,31 @@ class ConfigManager:
     def load_config(self) -> Dict[str, Any]:
         if not self.config_exists():
             raise FileNotFoundError(f"Configuration file '{self.config_path}' not found")
-        with open(self.config_path, 'r') as f:
-            return json.load(f)
+        # Same mtime/size-keyed cache that core's load_config reads through
+        return _read_json(self.config_path)
     
     def save_config(self, config_data: Dict[str, Any]):
-        with open(self.config_path, 'w') as f:
-            json.dump(config_data, f, indent=2)
+        # Form and prompt values are always text; keep config.json that way
+        for key, value in config_data.items():
+            if not isinstance(value, str):
+                raise TypeError(f"config value for '{key}' must be a string, got {type(value).__name__}")
+        _CACHE.pop(os.path.abspath(self.config_path), None)
+        with open(self.config_path, 'wb') as f:
+            f.write(_dumps(config_data))
     
     def create_config_gui(self, parent_window=None) -> bool:
         """Create configuration via GUI popup."""
-        if not GUI_AVAILABLE:
+        if not GUI_AVAILABLE or not _ensure_tk():
             print("❌ GUI not available. Please create config.json manually.")
             return False
         
-        config_data = DEFAULT_CONFIG.copy()
-        
-        # Create window
-        if parent_window:
-            config_window = tk.Toplevel(parent_window)
-            config_window.transient(parent_window)
-            config_window.grab_set()
-        else:
-            config_window = tk.Tk()
-        
-        config_window.title("Configuration Setup")
-        
-        # Make window modal
-        config_window.focus_set()
-        config_window.lift()
-        
-        # Create main frame
-        main_frame = tk.Frame(config_window, padx=20, pady=20)
-        main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Title
-        tk.Label(main_frame, text="Configuration Setup", 
-                font=("Arial", 14, "bold")).pack(pady=(0, 20))
-        
-        tk.Label(main_frame, text="Please fill in the configuration values:",
-                font=("Arial", 10)).pack(anchor=tk.W, pady=(0, 10))
-        
-        # Create scrollable area
-        canvas = tk.Canvas(main_frame)
-        scrollbar = tk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Add fields
-        entries = {}
-        row = 0
-        
-        for key, value in config_data.items():
-            tk.Label(scrollable_frame, text=f"{key}:", anchor="w").grid(
-                row=row, column=0, sticky="w", padx=5, pady=2)
-            
-            if "password" in key.lower() or "token" in key.lower():
-                entry = tk.Entry(scrollable_frame, width=40, show="*")
-            else:
-                entry = tk.Entry(scrollable_frame, width=40)
-            
-            entry.grid(row=row, column=1, padx=5, pady=2, sticky="w")
-            entry.insert(0, str(value))
-            entries[key] = entry
-            row += 1
-        
-        # Add buttons
-        button_frame = tk.Frame(scrollable_frame)
-        button_frame.grid(row=row, column=0, columnspan=2, pady=20)
-        
-        result = {"saved": False}
-        
-        def on_save():
-            # Get values from entries
-            for key, entry in entries.items():
-                config_data[key] = entry.get()
-            
-            try:
-                self.save_config(config_data)
-                result["saved"] = True
-                config_window.destroy()
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save configuration: {e}")
-        
-        def on_cancel():
-            config_window.destroy()
-        
-        # White buttons with black text
-        tk.Button(button_frame, text="Save", command=on_save, 
-                 bg="white", fg="black", width=15).pack(side=tk.LEFT, padx=5)
-        
-        tk.Button(button_frame, text="Cancel", command=on_cancel,
-                 bg="white", fg="black", width=15).pack(side=tk.LEFT, padx=5)
-        
-        # Pack scrollable area
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Set window size
-        config_window.geometry("700x500")
-        
-        # Center window
-        config_window.update_idletasks()
-        if parent_window:
-            x = parent_window.winfo_x() + (parent_window.winfo_width() - config_window.winfo_width()) // 2
-            y = parent_window.winfo_y() + (parent_window.winfo_height() - config_window.winfo_height()) // 2
-        else:
-            x = (config_window.winfo_screenwidth() - config_window.winfo_width()) // 2
-            y = (config_window.winfo_screenheight() - config_window.winfo_height()) // 2
-        
-        config_window.geometry(f"+{x}+{y}")
-        
-        # Wait for window to close
-        if parent_window:
-            config_window.wait_window()
-        else:
-            config_window.mainloop()
-        
-        return result["saved"]
+        return self._show_config_dialog(
+            title="Configuration Setup",
+            subtitle="Please fill in the configuration values:",
+            initial_config=DEFAULT_CONFIG.copy(),
+            parent_window=parent_window)
     
-    def create_config_cli(self) -> bool:
+    def create_config_cli(self, accept_defaults: bool = False) -> bool:
         """Create configuration via CLI input."""
         print("\n" + "="*60)
         print("Configuration Setup")
@@ -188,7 +118,7 @@ class ConfigManager:
         config_data = DEFAULT_CONFIG.copy()
         
         # Ask for essential fields first
-        essential_fields = ['host', 'username', 'postgres_host']
+        essential_fields = ('host', 'username', 'postgres_host')
         print("Essential fields:")
         for key in essential_fields:
             default = config_data.get(key, '')
@@ -196,30 +126,8 @@ class ConfigManager:
             if value:
                 config_data[key] = value
         
-        # Ask for optional fields
-        print("\nOptional fields (press Enter to skip):")
-        other_fields = [k for k in config_data.keys() if k not in essential_fields]
-        
-        for key in other_fields:
-            default = config_data.get(key, '')
-            
-            if any(sensitive in key.lower() for sensitive in ['password', 'token', 'secret']):
-                import getpass
-                prompt = f"{key}"
-                if default:
-                    masked = '*' * min(len(default), 8)
-                    prompt += f" [{masked}]"
-                prompt += ": "
-                value = getpass.getpass(prompt)
-            else:
-                prompt = f"{key}"
-                if default:
-                    prompt += f" [{default}]"
-                prompt += ": "
-                value = input(prompt).strip()
-            
-            if value:
-                config_data[key] = value
+        if not accept_defaults:
+            self._prompt_optional_fields(config_data, essential_fields)
         
         try:
             self.save_config(config_data)
@@ -229,10 +137,49 @@ class ConfigManager:
             print(f"\n❌ Failed to save configuration: {e}")
             return False
         
+    def _prompt_optional_fields(self, config_data: Dict[str, Any], skip) -> None:
+        """Collect optional overrides from a single 'key=value; ...' prompt."""
+        import re
+        import sys
+        
+        lines = ["\nOptional fields (Enter accepts all defaults):"]
+        lines.extend(f"  {key}{' (hidden)' if sensitive else ''}"
+                     for key, sensitive in _FIELDS if key not in skip)
+        lines.append("Name hidden fields without a value (key or key=); they are always prompted for.\n")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        
+        overrides = input("Enter 'key=value' overrides separated by ';': ").strip()
+        if not overrides:
+            return
+        
+        sensitive_keys = {key for key, sensitive in _FIELDS if sensitive}
+        # Split only where ';' starts 'key=' or a bare known key, so values may contain ';'
+        known = "|".join(re.escape(key) for key in sorted(config_data, key=len, reverse=True))
+        for item in re.split(rf";(?=\s*(?:[\w.-]+\s*=|(?:{known})\s*(?:;|$)))", overrides):
+            key, sep, value = item.partition('=')
+            key, value = key.strip(), value.strip()
+            if not key:
+                continue
+            if key not in config_data or key in skip:
+                print(f"⚠️ Ignoring unknown field '{key}'")
+                continue
+            if key in sensitive_keys:
+                # Secrets never come from the echoed line
+                if value:
+                    print(f"⚠️ Inline value for '{key}' ignored; enter it at the hidden prompt")
+                import getpass
+                value = getpass.getpass(f"{key}: ")
+            elif not sep:
+                print(f"⚠️ Ignoring '{key}' without a value")
+                continue
+            if value:
+                config_data[key] = value
+        
 # Add this method to the ConfigManager class in config_manager.py
     def edit_config_gui(self, parent_window=None) -> bool:
         """Edit existing configuration via GUI popup."""
-        if not GUI_AVAILABLE:
+        if not GUI_AVAILABLE or not _ensure_tk():
             print("❌ GUI not available. Please edit config.json manually.")
             return False
         
@@ -241,15 +188,28 @@ class ConfigManager:
             try:
                 config_data = self.load_config()
                 # Ensure all default keys are present (for backward compatibility)
-                for key in DEFAULT_CONFIG.keys():
-                    if key not in config_data:
-                        config_data[key] = DEFAULT_CONFIG[key]
+                for key in DEFAULT_CONFIG:
+                    config_data.setdefault(key, DEFAULT_CONFIG[key])
             except Exception as e:
                 print(f"❌ Failed to load existing config: {e}")
                 config_data = DEFAULT_CONFIG.copy()
         else:
             config_data = DEFAULT_CONFIG.copy()
         
+        return self._show_config_dialog(
+            title="Edit Configuration",
+            subtitle="Modify configuration values as needed:",
+            initial_config=config_data,
+            parent_window=parent_window)
+    
+    def _show_config_dialog(self, *, title: str, subtitle: str,
+                            initial_config: Dict[str, Any], parent_window=None) -> bool:
+        """Show the shared config form and save on confirm."""
+        config_data = initial_config
+        # Known fields first, then any extra keys carried by an existing file
+        fields = _FIELDS + tuple(
+            (key, _is_sensitive(key)) for key in config_data if key not in DEFAULT_CONFIG)
+        
         # Create window
         if parent_window:
             config_window = tk.Toplevel(parent_window)
@@ -258,7 +218,7 @@ class ConfigManager:
         else:
             config_window = tk.Tk()
         
-        config_window.title("Edit Configuration")
+        config_window.title(title)
         
         # Make window modal
         config_window.focus_set()
@@ -269,10 +229,10 @@ class ConfigManager:
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Title
-        tk.Label(main_frame, text="Edit Configuration", 
+        tk.Label(main_frame, text=title, 
                 font=("Arial", 14, "bold")).pack(pady=(0, 20))
         
-        tk.Label(main_frame, text="Modify configuration values as needed:",
+        tk.Label(main_frame, text=subtitle,
                 font=("Arial", 10)).pack(anchor=tk.W, pady=(0, 10))
         
         # Create scrollable area
@@ -292,17 +252,14 @@ class ConfigManager:
         entries = {}
         row = 0
         
-        for key, value in config_data.items():
-            tk.Label(scrollable_frame, text=f"{key}:", anchor="w").grid(
+        _Label, _Entry, sf = tk.Label, tk.Entry, scrollable_frame
+        for key, sensitive in fields:
+            _Label(sf, text=f"{key}:", anchor="w").grid(
                 row=row, column=0, sticky="w", padx=5, pady=2)
-            
-            if "password" in key.lower() or "token" in key.lower():
-                entry = tk.Entry(scrollable_frame, width=40, show="*")
-            else:
-                entry = tk.Entry(scrollable_frame, width=40)
-            
+            entry = _Entry(sf, width=40, show="*" if sensitive else "")
             entry.grid(row=row, column=1, padx=5, pady=2, sticky="w")
-            entry.insert(0, str(value))
+            value = config_data[key]
+            entry.insert(0, value if isinstance(value, str) else str(value))
             entries[key] = entry
             row += 1
         
@@ -338,19 +295,16 @@ class ConfigManager:
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Set window size
-        config_window.geometry("700x500")
-        
-        # Center window
-        config_window.update_idletasks()
+        # Size and center the window in one geometry call (no idle-task flush needed)
+        width, height = 700, 500
         if parent_window:
-            x = parent_window.winfo_x() + (parent_window.winfo_width() - config_window.winfo_width()) // 2
-            y = parent_window.winfo_y() + (parent_window.winfo_height() - config_window.winfo_height()) // 2
+            x = parent_window.winfo_x() + (parent_window.winfo_width() - width) // 2
+            y = parent_window.winfo_y() + (parent_window.winfo_height() - height) // 2
         else:
-            x = (config_window.winfo_screenwidth() - config_window.winfo_width()) // 2
-            y = (config_window.winfo_screenheight() - config_window.winfo_height()) // 2
+            x = (config_window.winfo_screenwidth() - width) // 2
+            y = (config_window.winfo_screenheight() - height) // 2
         
-        config_window.geometry(f"+{x}+{y}")
+        config_window.geometry(f"{width}x{height}+{x}+{y}")
         
         # Wait for window to close
         if parent_window:
@@ -360,6 +314,16 @@ class ConfigManager:
         
         return result["saved"]
     
+    def _certificate_presence(self):
+        """Return (root.crt exists, cacerts exists) from one home-dir scan."""
+        try:
+            with os.scandir(self.home_dir) as it:
+                present = {e.name for e in it
+                           if e.name in ('root.crt', 'cacerts') and e.is_file()}
+        except OSError:
+            return False, False
+        return 'root.crt' in present, 'cacerts' in present
+    
     def check_and_create_certificates(self, auto_create: bool = False) -> bool:
         """Check and create certificates."""
         if not self.config_exists():
@@ -378,8 +342,7 @@ class ConfigManager:
             root_crt = os.path.join(self.home_dir, 'root.crt')
             cacerts = os.path.join(self.home_dir, 'cacerts')
             
-            root_exists = os.path.exists(root_crt)
-            cacerts_exists = os.path.exists(cacerts)
+            root_exists, cacerts_exists = self._certificate_presence()
             
             if root_exists and cacerts_exists:
                 return True
@@ -413,19 +376,18 @@ class ConfigManager:
     
     def prompt_certificate_creation_gui(self, parent_window=None) -> bool:
         """Prompt for certificate creation in GUI."""
-        if not GUI_AVAILABLE:
+        if not GUI_AVAILABLE or not _ensure_tk():
             return False
         
-        root_crt = os.path.join(self.home_dir, 'root.crt')
-        cacerts = os.path.join(self.home_dir, 'cacerts')
+        root_exists, cacerts_exists = self._certificate_presence()
         
-        if os.path.exists(root_crt) and os.path.exists(cacerts):
+        if root_exists and cacerts_exists:
             return True
         
         missing = []
-        if not os.path.exists(root_crt):
+        if not root_exists:
             missing.append("root.crt")
-        if not os.path.exists(cacerts):
+        if not cacerts_exists:
             missing.append("cacerts")
         
         message = f"Missing certificates:\n\n"
@@ -448,17 +410,16 @@ class ConfigManager:
     
     def prompt_certificate_creation_cli(self) -> bool:
         """Prompt for certificate creation in CLI."""
-        root_crt = os.path.join(self.home_dir, 'root.crt')
-        cacerts = os.path.join(self.home_dir, 'cacerts')
+        root_exists, cacerts_exists = self._certificate_presence()
         
-        if os.path.exists(root_crt) and os.path.exists(cacerts):
+        if root_exists and cacerts_exists:
             print("✅ Certificates found")
             return True
         
         print("\n⚠ Missing certificates:")
-        if not os.path.exists(root_crt):
+        if not root_exists:
             print("  ❌ root.crt")
-        if not os.path.exists(cacerts):
+        if not cacerts_exists:
             print("  ❌ cacerts")
         
         response = input("\nCreate missing certificates? (yes/no): ").strip().lower()
@@ -473,21 +434,25 @@ class ConfigManager:
         """Create root certificate."""
         try:
             import ssl
-            import socket
+            import sys
             
-            context = ssl.create_default_context()
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
+            if sys.version_info >= (3, 10):
+                cert_pem = ssl.get_server_certificate((host, 10500), timeout=10)
+            else:
+                # get_server_certificate has no timeout before 3.10
+                import socket
+                context = ssl.create_default_context()
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+                with socket.create_connection((host, 10500), timeout=10) as sock:
+                    with context.wrap_socket(sock, server_hostname=host) as ssock:
+                        cert_bin = ssock.getpeercert(binary_form=True)
+                if not cert_bin:
+                    return False
+                cert_pem = ssl.DER_cert_to_PEM_cert(cert_bin)
             
-            with socket.create_connection((host, 10500), timeout=10) as sock:
-                with context.wrap_socket(sock, server_hostname=host) as ssock:
-                    cert_bin = ssock.getpeercert(binary_form=True)
-                    if cert_bin:
-                        cert_pem = ssl.DER_cert_to_PEM_cert(cert_bin)
-                        with open(output_path, 'w') as f:
-                            f.write(cert_pem)
-                        return True
-            return False
+            Path(output_path).write_text(cert_pem)
+            return True
         except Exception:
             return False
     
@@ -496,8 +461,25 @@ class ConfigManager:
         if not os.path.exists(cert_path):
             return False
         
+        try:
+            import jks  # pyjks
+        except ImportError:
+            jks = None
+        
+        if jks is not None:
+            # Write the JKS in-process; no JVM spawn needed
+            try:
+                import ssl
+                cert_der = ssl.PEM_cert_to_DER_cert(Path(cert_path).read_text())
+                entry = jks.TrustedCertEntry.new(host.lower(), cert_der)
+                jks.KeyStore.new('jks', [entry]).save(keystore_path, 'changeit')
+                return True
+            except Exception:
+                return False
+        
         try:
             import shutil
+            import subprocess
             keytool = shutil.which('keytool')
             if not keytool:
                 return False
@@ -515,4 +497,16 @@ class ConfigManager:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
             return result.returncode == 0
         except Exception:
-            return False
\ No newline at end of file
+            return False
+
+
+# One ConfigManager per config path for the whole process
+_MANAGERS: Dict[str, ConfigManager] = {}
+
+
+def get_config_manager(config_path: str = "config.json") -> ConfigManager:
+    """Return the shared ConfigManager for `config_path`, creating it once."""
+    manager = _MANAGERS.get(config_path)
+    if manager is None:
+        manager = _MANAGERS[config_path] = ConfigManager(config_path)
+    return manager
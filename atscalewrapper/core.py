@@ -9,13 +9,12 @@ def create_core(config_path=None):
     `config.json` in the repository root.
     """
     if config_path is None:
-        # Prefer package-local config if present
+        # Prefer package-local config if present; otherwise the top-level one
         pkg_config = os.path.join(os.path.dirname(__file__), "config.json")
-        if os.path.exists(pkg_config):
+        try:
+            os.stat(pkg_config)
             config_path = pkg_config
-        elif os.path.exists("config.json"):
-            config_path = "config.json"
-        else:
+        except FileNotFoundError:
             config_path = "config.json"
 
     return AtScaleGatlingCore(config_path=config_path)
@@ -24,19 +23,106 @@ __all__ = ["create_core"]
 """Core functionality that works for both GUI and CLI"""
 import os
 import subprocess
+import sys
 import requests
+from requests.adapters import HTTPAdapter
 import xml.etree.ElementTree as ET
-import json
 import urllib3
+try:
+    from lxml import etree as LET
+except ImportError:  # lxml is optional; fall back to ElementTree
+    LET = None
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from string import Template
+
+from .config import Constants, load_config
 
 # Suppress SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# MDSCHEMA_CUBES envelope as bytes; only the catalog is substituted per call
+_CUBE_QUERY_TMPL = b"\n".join(line.strip().encode("utf-8") for line in """<?xml version="1.0" encoding="utf-8"?>
+    <soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"
+                   xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+                   xmlns:xsd="http://www.w3.org/2001/XMLSchema">
+      <soap:Body>
+        <Execute xmlns="urn:schemas-microsoft-com:xml-analysis">
+          <Command>
+            <Statement>
+                  SELECT [CUBE_NAME] from $system.MDSCHEMA_CUBES
+            </Statement>
+          </Command>
+          <Properties>
+            <PropertyList>
+              <Catalog>%b</Catalog>
+              <Cube>Default</Cube>
+            </PropertyList>
+          </Properties>
+        </Execute>
+      </soap:Body>
+    </soap:Envelope>""".splitlines() if line.strip())
+
+# systems.properties blocks, filled per catalog/cube pair
+_PAIR_BODY = (
+    "atscale.${cube_key}.jdbc.url=${jdbc_prefix}${catalog_jdbc}\n"
+    "atscale.${cube_key}.jdbc.username=${username}\n"
+    "atscale.${cube_key}.jdbc.password=${password}\n"
+    "atscale.${cube_key}.jdbc.maxPoolSize=10\n"
+    "atscale.${cube_key}.jdbc.log.resultset.rows=true\n"
+    "${jdbc_file_block}"
+    "atscale.${cube_key}.xmla.auth.url=${xmla_auth_url}\n"
+    "atscale.${cube_key}.xmla.url=${xmla_url}\n"
+    "atscale.${cube_key}.xmla.cube=${cube}\n"
+    "atscale.${cube_key}.xmla.catalog=${catalog}\n"
+    "atscale.${cube_key}.xmla.log.responsebody=true\n"
+    "atscale.${cube_key}.xmla.auth.username=${username}\n"
+    "atscale.${cube_key}.xmla.auth.password=${password}\n"
+    "${xmla_file_block}"
+    "# \n"
+)
+_PAIR_TEMPLATE = Template("# ${catalog} :: ${cube}\n" + _PAIR_BODY)
+_PAIR_TEMPLATE_CSV = Template(_PAIR_BODY)  # legacy CSV layout: no per-pair comment
+_INGEST_TEMPLATE = Template(
+    "atscale.${cube_key}.${kind}.setIngestionFileName=${file}\n"
+    "atscale.${cube_key}.${kind}.setIngestionFileHasHeader=${has_header}\n"
+)
+# Optional config keys copied through verbatim when set
+_OPTIONAL_KEYS = (
+    "aws.region", "aws.secrets-key",
+    "snowflake.archive.account", "snowflake.archive.warehouse",
+    "snowflake.archive.database", "snowflake.archive.schema",
+    "snowflake.archive.role", "snowflake.archive.username",
+)
+_SYSTEM_PARAMETERS = (
+    "atscale.postgres.jdbc.username=atscale\n"
+    "atscale.postgres.jdbc.password=atscale\n"
+    "#System Parameter\n"
+    "atscale.gatling.throttle.ms=5\n"
+    "atscale.xmla.maxConnectionsPerHost=20\n"
+    "atscale.xmla.useAggregates=true\n"
+    "atscale.xmla.generateAggregates=false\n"
+    "atscale.xmla.useQueryCache=false\n"
+    "atscale.xmla.useAggregateCache=true\n"
+    "atscale.jdbc.useAggregates=true\n"
+    "atscale.jdbc.generateAggregates=false\n"
+    "atscale.jdbc.useLocalCache=false\n"
+)
+
+ROWSET_NS = "urn:schemas-microsoft-com:xml-analysis:rowset"
+
+
 class AtScaleGatlingCore:
+    # Compiled once; text() returns the strings without building element proxies
+    if LET is not None:
+        _XP_CAT = LET.XPath("//r:CATALOG_NAME/text()", namespaces={"r": ROWSET_NS})
+        _XP_CUBE = LET.XPath("//r:CUBE_NAME/text()", namespaces={"r": ROWSET_NS})
+    else:
+        _XP_CAT = _XP_CUBE = None
+    
     def __init__(self, config_path="config.json"):
-        with open(config_path) as f:
-            self.cfg = json.load(f)
+        # Parsed once per process; re-read only if the file's mtime/size change
+        self.cfg = load_config(config_path)
             
         self.working_dir = "working_dir"
         self.control_dir = os.path.join(self.working_dir, "control")
@@ -45,25 +131,13 @@ class AtScaleGatlingCore:
         self.ingest_dir = os.path.join(self.working_dir, "ingest")
         
         # Create directories if they don't exist
-        os.makedirs(self.control_dir, exist_ok=True)
-        os.makedirs(self.run_logs_dir, exist_ok=True)
-        os.makedirs(self.config_dir, exist_ok=True)
-        os.makedirs(self.ingest_dir, exist_ok=True)
+        self._ensure_leaves(self.working_dir, ("control", "run_logs", "config", "ingest"))
         
         self.DOCKER_IMAGE = "rwidjaja/atscale-gatling:latest"
+        self._docker_image_ok = False  # set once inspect/pull succeeds
         
-        # Simulation executors
-        self.executors = [
-            "InstallerVerQueryExtractExecutor",
-            "CustomQueryExtractExecutor", 
-            "QueryExtractExecutor",
-            "OpenStepConcurrentSimulationExecutor",
-            "ClosedStepConcurrentSimulationExecutor",
-            "OpenStepSequentialSimulationExecutor",
-            "ClosedStepSequentialSimulationExecutor",
-            "ArchiveJdbcToSnowflake",
-            "ArchiveXmlaToSnowflake"
-        ]
+        # Simulation executors (same list the CLI validates against)
+        self.executors = list(Constants.EXECUTORS)
         
         self.current_process = None
         self.is_running = False
@@ -71,6 +145,24 @@ class AtScaleGatlingCore:
         self.catalog_cube_pairs = []
         self.csv_mode = False  # Track if we're in CSV mode
         self.csv_file_assignments = None  # Store CSV file assignments
+        
+        # Keep-alive session shared by every XMLA call, including discovery threads
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+        self._http.auth = (self.cfg["username"], self.cfg["password"])
+        self._http.verify = False
+        # requests already asks for gzip/deflate by default
+        self._http.headers.update({"Content-Type": "text/xml", "Accept": "text/xml"})
+
+    @staticmethod
+    def _ensure_leaves(parent, leaves):
+        """Create `parent` once, then each leaf with a single mkdir"""
+        os.makedirs(parent, exist_ok=True)
+        for leaf in leaves:
+            try:
+                os.mkdir(os.path.join(parent, leaf))
+            except FileExistsError:
+                pass
 
     def discover_and_setup(self):
         """Discover catalogs/cubes"""
@@ -82,11 +174,10 @@ class AtScaleGatlingCore:
                 print("❌ No catalogs found")
                 return False
                 
-            pairs = []
-            for cat in catalogs:
-                cubes = self.discover_cubes(cat)
-                for cube in cubes:
-                    pairs.append(f"{cat} :: {cube}")
+            # Per-catalog cube queries are independent; overlap their round-trips
+            with ThreadPoolExecutor(max_workers=min(8, len(catalogs))) as pool:
+                cube_lists = list(pool.map(self.discover_cubes, catalogs))
+            pairs = [f"{cat} :: {cube}" for cat, cubes in zip(catalogs, cube_lists) for cube in cubes]
                     
             self.catalog_cube_pairs = pairs
             print(f"✅ Discovery complete: {len(pairs)} catalog/cube pairs")
@@ -98,187 +189,144 @@ class AtScaleGatlingCore:
 
     def discover_catalogs(self):
         """Discover catalogs using XMLA"""
-        CATALOG_QUERY = """<?xml version="1.0" encoding="utf-8"?>
-        <soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"
-                       xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
-                       xmlns:xsd="http://www.w3.org/2001/XMLSchema">
-          <soap:Body>
-            <Execute xmlns="urn:schemas-microsoft-com:xml-analysis">
-              <Command>
-                <Statement>
-                      SELECT [CATALOG_NAME] from $system.DBSCHEMA_CATALOGS
-                </Statement>
-              </Command>
-              <Properties>
-                <PropertyList>
-                  <Catalog>Default</Catalog>
-                  <Cube>Default</Cube>
-                </PropertyList>
-              </Properties>
-            </Execute>
-          </soap:Body>
-        </soap:Envelope>"""
-        
-        xml_response = self.run_xmla_query(CATALOG_QUERY)
-        return self.parse_catalogs(xml_response)
+        with self.run_xmla_query(Constants.CATALOG_QUERY, stream=True) as resp:
+            return self.parse_catalogs(resp.raw)
         
     def discover_cubes(self, catalog):
         """Discover cubes for a catalog"""
-        CUBE_QUERY = f"""<?xml version="1.0" encoding="utf-8"?>
-        <soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"
-                       xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
-                       xmlns:xsd="http://www.w3.org/2001/XMLSchema">
-          <soap:Body>
-            <Execute xmlns="urn:schemas-microsoft-com:xml-analysis">
-              <Command>
-                <Statement>
-                      SELECT [CUBE_NAME] from $system.MDSCHEMA_CUBES
-                </Statement>
-              </Command>
-              <Properties>
-                <PropertyList>
-                  <Catalog>{catalog}</Catalog>
-                  <Cube>Default</Cube>
-                </PropertyList>
-              </Properties>
-            </Execute>
-          </soap:Body>
-        </soap:Envelope>"""
+        with self.run_xmla_query(self._cube_query(catalog), stream=True) as resp:
+            return self.parse_cubes(resp.raw)
         
-        xml_response = self.run_xmla_query(CUBE_QUERY)
-        return self.parse_cubes(xml_response)
+    @staticmethod
+    def _cube_query(catalog):
+        """MDSCHEMA_CUBES request body for one catalog"""
+        return _CUBE_QUERY_TMPL % catalog.encode("utf-8")
         
-    def run_xmla_query(self, xml_body):
-        """Run XMLA query"""
+    def run_xmla_query(self, xml_body, stream=False):
+        """Run XMLA query (bytes body); returns the body bytes, or the open response when streaming"""
         url = f"https://{self.cfg['host']}:10502/xmla/default"
-        resp = requests.post(
+        resp = self._http.post(
             url,
-            data=xml_body.encode("utf-8"),
-            headers={"Content-Type": "text/xml"},
-            auth=(self.cfg["username"], self.cfg["password"]),
-            verify=False
+            data=xml_body,
+            timeout=(5, 60),
+            stream=stream
         )
         resp.raise_for_status()
-        return resp.text
+        if stream:
+            # Let urllib3 gunzip while the parser reads from the socket
+            resp.raw.decode_content = True
+            return resp
+        return resp.content
+        
+    def _rowset_texts(self, src, local_name, xpath):
+        """Column values from bytes/str (compiled XPath) or a file-like (iterparse)"""
+        if isinstance(src, str):
+            src = src.encode("utf-8")
+        if isinstance(src, bytes):
+            if LET is not None:
+                return [str(t) for t in xpath(LET.fromstring(src))]
+            return [el.text for el in ET.fromstring(src).iter(f"{{{ROWSET_NS}}}{local_name}")]
+        
+        tag = f"{{{ROWSET_NS}}}{local_name}"
+        values = []
+        if LET is not None:
+            for _, el in LET.iterparse(src, events=("end",), tag=tag):
+                values.append(el.text)
+                el.clear()
+        else:
+            for _, el in ET.iterparse(src, events=("end",)):
+                if el.tag == tag:
+                    values.append(el.text)
+                    el.clear()
+        return values
         
     def parse_catalogs(self, xml_text):
         """Parse catalogs from XML response"""
-        root = ET.fromstring(xml_text)
-        return [el.text for el in root.findall(".//{urn:schemas-microsoft-com:xml-analysis:rowset}CATALOG_NAME")]
+        return self._rowset_texts(xml_text, "CATALOG_NAME", self._XP_CAT)
         
     def parse_cubes(self, xml_text):
         """Parse cubes from XML response"""
-        root = ET.fromstring(xml_text)
-        return [el.text for el in root.findall(".//{urn:schemas-microsoft-com:xml-analysis:rowset}CUBE_NAME")]
+        return self._rowset_texts(xml_text, "CUBE_NAME", self._XP_CUBE)
         
     def write_systems_properties_with_csv(self, selected_pairs, file_assignments=None):
         """Write systems.properties file with optional CSV file assignments"""
+        if file_assignments:
+            header = "# CSV Mode - Executors will read from CSV files\natscale.schema.type=ingestion\n"
+        else:
+            header = "# Live Mode - Executors will make live JDBC/XMLA calls\natscale.schema.type=installer\n"
+        self._write_systems_properties(selected_pairs, file_assignments, header, _PAIR_TEMPLATE)
+        mode = "CSV" if file_assignments else "Live"
+        print(f"✅ systems.properties regenerated for {mode} mode with {len(selected_pairs)} selected pairs")
+
+    def _write_systems_properties(self, selected_pairs, file_assignments, header, template):
+        """Render every pair through `template` and write the file in one call"""
         if not selected_pairs:
             raise ValueError("No catalog/cube pairs selected")
-            
-        cubes = [pair.split("::")[1].strip() for pair in selected_pairs]
-        catalogs = [pair.split("::")[0].strip() for pair in selected_pairs]
 
-        filepath = os.path.join(self.config_dir, "systems.properties")
+        # Everything that is the same for every pair is resolved once here
+        cfg = self.cfg
+        host = cfg["host"]
+        values = {
+            "username": cfg["username"], "password": cfg["password"],
+            "jdbc_prefix": f"jdbc:postgresql://{host}:15432/",
+            "xmla_auth_url": f"https://{host}:10500/default/auth",
+            "xmla_url": f"https://{host}:10502/xmla/default/{cfg['token']}",
+        }
+        # One pass over the pairs into parallel columns
+        catalogs, cubes, cube_keys, catalog_jdbc_names = [], [], [], []
+        for pair in selected_pairs:
+            catalog, cube = pair.split("::", 1)
+            catalog, cube = catalog.strip(), cube.strip()
+            catalogs.append(catalog)
+            cubes.append(cube)
+            cube_keys.append(cube.replace(" ", "_"))
+            catalog_jdbc_names.append(catalog.replace(" ", "%20"))
+        parts = [header, "atscale.models=" + ", ".join(catalogs) + "\n"]
 
-        with open(filepath, "w") as f:
-            # Determine schema type based on whether CSV files are provided
-            if file_assignments:
-                f.write("# CSV Mode - Executors will read from CSV files\n")
-                f.write("atscale.schema.type=ingestion\n")
-            else:
-                f.write("# Live Mode - Executors will make live JDBC/XMLA calls\n")
-                f.write("atscale.schema.type=installer\n")
-                
-            f.write("atscale.models=" + ", ".join(catalogs) + "\n")
+        for pair, catalog, cube, cube_key, catalog_jdbc in zip(
+                selected_pairs, catalogs, cubes, cube_keys, catalog_jdbc_names):
+            jdbc_block = xmla_block = ""
+            # Ingestion files are bare filenames; Docker resolves them in working_dir/ingest
+            assignment = file_assignments.get(pair) if file_assignments else None
+            if assignment:
+                if assignment.get('jdbc_file'):
+                    jdbc_block = _INGEST_TEMPLATE.substitute(
+                        cube_key=cube_key, kind="jdbc", file=assignment['jdbc_file'],
+                        has_header=str(assignment.get('jdbc_has_header', True)).lower())
+                if assignment.get('xmla_file'):
+                    xmla_block = _INGEST_TEMPLATE.substitute(
+                        cube_key=cube_key, kind="xmla", file=assignment['xmla_file'],
+                        has_header=str(assignment.get('xmla_has_header', True)).lower())
+            parts.append(template.substitute(
+                values, cube_key=cube_key, cube=cube, catalog=catalog,
+                catalog_jdbc=catalog_jdbc,
+                jdbc_file_block=jdbc_block, xmla_file_block=xmla_block))
 
-            for pair in selected_pairs:
-                catalog, cube = [p.strip() for p in pair.split("::")]
-                cube_key = cube.replace(" ", "_")
-                catalog_jdbc_name = catalog.replace(" ", "%20")
+        parts.append(f"atscale.postgres.jdbc.url=jdbc:postgresql://{cfg['postgres_host']}:10520/atscale\n")
+        parts.append(_SYSTEM_PARAMETERS)
 
-                f.write(f"# {catalog} :: {cube}\n")
-                f.write(f"atscale.{cube_key}.jdbc.url=jdbc:postgresql://{self.cfg['host']}:15432/{catalog_jdbc_name}\n")
-                f.write(f"atscale.{cube_key}.jdbc.username={self.cfg['username']}\n")
-                f.write(f"atscale.{cube_key}.jdbc.password={self.cfg['password']}\n")
-                f.write(f"atscale.{cube_key}.jdbc.maxPoolSize=10\n")
-                f.write(f"atscale.{cube_key}.jdbc.log.resultset.rows=true\n")
-                
-                # Add CSV configuration if provided - JUST FILENAME, NO PATH
-                if file_assignments and pair in file_assignments:
-                    assignment = file_assignments[pair]
-                    jdbc_file = assignment.get('jdbc_file', '')
-                    xmla_file = assignment.get('xmla_file', '')
-                    jdbc_has_header = assignment.get('jdbc_has_header', True)
-                    xmla_has_header = assignment.get('xmla_has_header', True)
-                    
-                    if jdbc_file:
-                        # Just filename, no path - Docker will look in working_dir/ingest
-                        f.write(f"atscale.{cube_key}.jdbc.setIngestionFileName={jdbc_file}\n")
-                        f.write(f"atscale.{cube_key}.jdbc.setIngestionFileHasHeader={str(jdbc_has_header).lower()}\n")
-                
-                f.write(f"atscale.{cube_key}.xmla.auth.url=https://{self.cfg['host']}:10500/default/auth\n")
-                f.write(f"atscale.{cube_key}.xmla.url=https://{self.cfg['host']}:10502/xmla/default/{self.cfg['token']}\n")
-                f.write(f"atscale.{cube_key}.xmla.cube={cube}\n")
-                f.write(f"atscale.{cube_key}.xmla.catalog={catalog}\n")
-                f.write(f"atscale.{cube_key}.xmla.log.responsebody=true\n")
-                f.write(f"atscale.{cube_key}.xmla.auth.username={self.cfg['username']}\n")
-                f.write(f"atscale.{cube_key}.xmla.auth.password={self.cfg['password']}\n")
-                
-                # Add CSV configuration if provided - JUST FILENAME, NO PATH
-                if file_assignments and pair in file_assignments:
-                    assignment = file_assignments[pair]
-                    xmla_file = assignment.get('xmla_file', '')
-                    xmla_has_header = assignment.get('xmla_has_header', True)
-                    
-                    if xmla_file:
-                        # Just filename, no path - Docker will look in working_dir/ingest
-                        f.write(f"atscale.{cube_key}.xmla.setIngestionFileName={xmla_file}\n")
-                        f.write(f"atscale.{cube_key}.xmla.setIngestionFileHasHeader={str(xmla_has_header).lower()}\n")
-                
-                f.write("# \n")
+        # Add AWS and Snowflake config if present (one lookup per key)
+        cfg_get = cfg.get
+        for key in _OPTIONAL_KEYS:
+            value = cfg_get(key)
+            if value:
+                parts.append(f"{key}={value}\n")
+        if cfg_get("snowflake.archive.password"):
+            parts.append(f"snowflake.archive.password={cfg['snowflake.archive.token']}\n")
+        if cfg_get("snowflake.archive.token"):
+            parts.append(f"snowflake.archive.token={cfg['snowflake.archive.token']}\n")
+
+        # One encode, one os.write loop on a raw fd; no text-stream layer
+        body = "".join(parts).encode("utf-8")
+        filepath = os.path.join(self.config_dir, "systems.properties")
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(body)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
 
-            f.write(f"atscale.postgres.jdbc.url=jdbc:postgresql://{self.cfg['postgres_host']}:10520/atscale\n")
-            f.write("atscale.postgres.jdbc.username=atscale\n")
-            f.write("atscale.postgres.jdbc.password=atscale\n")
-            f.write("#System Parameter\n")
-            f.write("atscale.gatling.throttle.ms=5\n")
-            f.write("atscale.xmla.maxConnectionsPerHost=20\n")
-            f.write("atscale.xmla.useAggregates=true\n")
-            f.write("atscale.xmla.generateAggregates=false\n")
-            f.write("atscale.xmla.useQueryCache=false\n")
-            f.write("atscale.xmla.useAggregateCache=true\n")
-            f.write("atscale.jdbc.useAggregates=true\n")
-            f.write("atscale.jdbc.generateAggregates=false\n")
-            f.write("atscale.jdbc.useLocalCache=false\n")
-            
-            # Add AWS config if present
-            if self.cfg.get("aws.region"):
-                f.write(f"aws.region={self.cfg['aws.region']}\n")
-            if self.cfg.get("aws.secrets-key"):
-                f.write(f"aws.secrets-key={self.cfg['aws.secrets-key']}\n")
-                
-            # Add Snowflake config if present
-            if self.cfg.get("snowflake.archive.account"):
-                f.write(f"snowflake.archive.account={self.cfg['snowflake.archive.account']}\n")
-            if self.cfg.get("snowflake.archive.warehouse"):
-                f.write(f"snowflake.archive.warehouse={self.cfg['snowflake.archive.warehouse']}\n")
-            if self.cfg.get("snowflake.archive.database"):
-                f.write(f"snowflake.archive.database={self.cfg['snowflake.archive.database']}\n")
-            if self.cfg.get("snowflake.archive.schema"):
-                f.write(f"snowflake.archive.schema={self.cfg['snowflake.archive.schema']}\n")
-            if self.cfg.get("snowflake.archive.role"):
-                f.write(f"snowflake.archive.role={self.cfg['snowflake.archive.role']}\n")
-            if self.cfg.get("snowflake.archive.username"):
-                f.write(f"snowflake.archive.username={self.cfg['snowflake.archive.username']}\n")
-            if self.cfg.get("snowflake.archive.password"):
-                f.write(f"snowflake.archive.password={self.cfg['snowflake.archive.token']}\n")
-            if self.cfg.get("snowflake.archive.token"):
-                f.write(f"snowflake.archive.token={self.cfg['snowflake.archive.token']}\n")
-                
-        mode = "CSV" if file_assignments else "Live"
-        print(f"✅ systems.properties regenerated for {mode} mode with {len(selected_pairs)} selected pairs")
-            
     def build_docker_command(self, executor_name):
         """Build Docker command"""
         cmd = [
@@ -318,93 +366,22 @@ class AtScaleGatlingCore:
         
     def ensure_docker_image(self):
         """Check and pull Docker image if needed"""
+        if self._docker_image_ok:
+            return True
         try:
-            result = subprocess.run(["docker", "image", "inspect", self.DOCKER_IMAGE], 
-                                  capture_output=True)
-            if result.returncode == 0:
-                return True
-                
-            print("Pulling Docker image...")
-            result = subprocess.run(["docker", "pull", self.DOCKER_IMAGE])
-            return result.returncode == 0
+            result = subprocess.run(["docker", "image", "inspect", self.DOCKER_IMAGE],
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if result.returncode != 0:
+                print("Pulling Docker image...")
+                result = subprocess.run(["docker", "pull", self.DOCKER_IMAGE])
+            self._docker_image_ok = result.returncode == 0
+            return self._docker_image_ok
         except:
             return False
             
     def write_systems_properties(self, selected_pairs):
         """Write systems.properties file with selected catalog/cube pairs (LIVE MODE)"""
-        if not selected_pairs:
-            raise ValueError("No catalog/cube pairs selected")
-            
-        cubes = [pair.split("::")[1].strip() for pair in selected_pairs]
-        catalogs = [pair.split("::")[0].strip() for pair in selected_pairs]
-
-        filepath = os.path.join(self.config_dir, "systems.properties")
-
-        with open(filepath, "w") as f:
-            f.write("# Live Mode - Executors will make live JDBC/XMLA calls\n")
-            f.write("atscale.schema.type=installer\n")
-            f.write("atscale.models=" + ", ".join(catalogs) + "\n")
-
-            for pair in selected_pairs:
-                catalog, cube = [p.strip() for p in pair.split("::")]
-                cube_key = cube.replace(" ", "_")
-                catalog_jdbc_name = catalog.replace(" ", "%20")
-
-                f.write(f"# {catalog} :: {cube}\n")
-                f.write(f"atscale.{cube_key}.jdbc.url=jdbc:postgresql://{self.cfg['host']}:15432/{catalog_jdbc_name}\n")
-                f.write(f"atscale.{cube_key}.jdbc.username={self.cfg['username']}\n")
-                f.write(f"atscale.{cube_key}.jdbc.password={self.cfg['password']}\n")
-                f.write(f"atscale.{cube_key}.jdbc.maxPoolSize=10\n")
-                f.write(f"atscale.{cube_key}.jdbc.log.resultset.rows=true\n")
-                f.write(f"atscale.{cube_key}.xmla.auth.url=https://{self.cfg['host']}:10500/default/auth\n")
-                f.write(f"atscale.{cube_key}.xmla.url=https://{self.cfg['host']}:10502/xmla/default/{self.cfg['token']}\n")
-                f.write(f"atscale.{cube_key}.xmla.cube={cube}\n")
-                f.write(f"atscale.{cube_key}.xmla.catalog={catalog}\n")
-                f.write(f"atscale.{cube_key}.xmla.log.responsebody=true\n")
-                f.write(f"atscale.{cube_key}.xmla.auth.username={self.cfg['username']}\n")
-                f.write(f"atscale.{cube_key}.xmla.auth.password={self.cfg['password']}\n")
-                f.write("# \n")
-
-            f.write(f"atscale.postgres.jdbc.url=jdbc:postgresql://{self.cfg['postgres_host']}:10520/atscale\n")
-            f.write("atscale.postgres.jdbc.username=atscale\n")
-            f.write("atscale.postgres.jdbc.password=atscale\n")
-            f.write("#System Parameter\n")
-            f.write("atscale.gatling.throttle.ms=5\n")
-            f.write("atscale.xmla.maxConnectionsPerHost=20\n")
-            f.write("atscale.xmla.useAggregates=true\n")
-            f.write("atscale.xmla.generateAggregates=false\n")
-            f.write("atscale.xmla.useQueryCache=false\n")
-            f.write("atscale.xmla.useAggregateCache=true\n")
-            f.write("atscale.jdbc.useAggregates=true\n")
-            f.write("atscale.jdbc.generateAggregates=false\n")
-            f.write("atscale.jdbc.useLocalCache=false\n")
-            
-            # Add AWS config if present
-            if self.cfg.get("aws.region"):
-                f.write(f"aws.region={self.cfg['aws.region']}\n")
-            if self.cfg.get("aws.secrets-key"):
-                f.write(f"aws.secrets-key={self.cfg['aws.secrets-key']}\n")
-                
-            # Add Snowflake config if present
-            if self.cfg.get("snowflake.archive.account"):
-                f.write(f"snowflake.archive.account={self.cfg['snowflake.archive.account']}\n")
-            if self.cfg.get("snowflake.archive.warehouse"):
-                f.write(f"snowflake.archive.warehouse={self.cfg['snowflake.archive.warehouse']}\n")
-            if self.cfg.get("snowflake.archive.database"):
-                f.write(f"snowflake.archive.database={self.cfg['snowflake.archive.database']}\n")
-            if self.cfg.get("snowflake.archive.schema"):
-                f.write(f"snowflake.archive.schema={self.cfg['snowflake.archive.schema']}\n")
-            if self.cfg.get("snowflake.archive.role"):
-                f.write(f"snowflake.archive.role={self.cfg['snowflake.archive.role']}\n")
-            if self.cfg.get("snowflake.archive.username"):
-                f.write(f"snowflake.archive.username={self.cfg['snowflake.archive.username']}\n")
-            if self.cfg.get("snowflake.archive.password"):
-                f.write(f"snowflake.archive.password={self.cfg['snowflake.archive.token']}\n")
-            if self.cfg.get("snowflake.archive.token"):
-                f.write(f"snowflake.archive.token={self.cfg['snowflake.archive.token']}\n")
-                
-        print(f"✅ systems.properties regenerated for Live mode with {len(selected_pairs)} selected pairs")
-        
+        self.write_systems_properties_with_csv(selected_pairs)
         
     def run_executor(self, executor_name, selected_pairs, follow_logs=False):
         """Run an executor with selected catalog/cube pairs"""
@@ -490,27 +467,38 @@ class AtScaleGatlingCore:
         print(f"Log file: {log_file}")
         print("Press Ctrl+C to stop tailing (executor will continue running)\n")
         
+        # Follow the log in-process: one read per 64 KiB instead of a tail child
+        # and a line at a time. The log is truncated per run, so start at 0.
+        fd = os.open(log_file, os.O_RDONLY)
+        sys.stdout.flush()  # keep the banner ahead of raw log bytes
+        out = sys.stdout.buffer
         try:
-            # Use tail -f to follow logs
-            tail_process = subprocess.Popen(['tail', '-f', log_file], 
-                                          stdout=subprocess.PIPE, 
-                                          stderr=subprocess.PIPE,
-                                          text=True)
-            
-            while self.current_process.poll() is None and tail_process.poll() is None:
-                line = tail_process.stdout.readline()
-                if line:
-                    print(line, end='', flush=True)
-                time.sleep(0.1)
-                
-            tail_process.terminate()
-            
+            while True:
+                data = os.read(fd, 65536)
+                if data:
+                    out.write(data)
+                    out.flush()
+                    continue
+                if self.current_process.poll() is not None:
+                    # Drain whatever the child wrote between the last read and exiting
+                    while True:
+                        data = os.read(fd, 65536)
+                        if not data:
+                            break
+                        out.write(data)
+                    out.flush()
+                    break
+                # Regular files always poll readable; block on the child instead
+                try:
+                    self.current_process.wait(timeout=0.2)
+                except subprocess.TimeoutExpired:
+                    pass
         except KeyboardInterrupt:
             print("\n⏹️  Stopped tailing logs (executor continues running)")
-            if tail_process:
-                tail_process.terminate()
         except Exception as e:
             print(f"Error tailing logs: {e}")
+        finally:
+            os.close(fd)
             
     def stop_simulation(self):
         """Create stop signal file"""
@@ -539,91 +527,7 @@ class AtScaleGatlingCore:
     
     def write_csv_systems_properties(self, selected_pairs, file_assignments):
         """Write systems.properties file for CSV mode"""
-        if not selected_pairs:
-            raise ValueError("No catalog/cube pairs selected")
-            
-        cubes = [pair.split("::")[1].strip() for pair in selected_pairs]
-        catalogs = [pair.split("::")[0].strip() for pair in selected_pairs]
-
-        filepath = os.path.join(self.config_dir, "systems.properties")
-
-        with open(filepath, "w") as f:
-            f.write("# CSV Mode Configuration\n")
-            f.write("atscale.schema.type=ingestion\n")
-            f.write("atscale.models=" + ", ".join(catalogs) + "\n")
-
-            for pair in selected_pairs:
-                catalog, cube = [p.strip() for p in pair.split("::")]
-                cube_key = cube.replace(" ", "_")
-                catalog_jdbc_name = catalog.replace(" ", "%20")
-
-                # Get file assignments for this pair
-                assignment = file_assignments.get(pair, {})
-                jdbc_file = assignment.get('jdbc_file', '')
-                xmla_file = assignment.get('xmla_file', '')
-                jdbc_has_header = assignment.get('jdbc_has_header', True)
-                xmla_has_header = assignment.get('xmla_has_header', True)
-
-                f.write(f"atscale.{cube_key}.jdbc.url=jdbc:postgresql://{self.cfg['host']}:15432/{catalog_jdbc_name}\n")
-                f.write(f"atscale.{cube_key}.jdbc.username={self.cfg['username']}\n")
-                f.write(f"atscale.{cube_key}.jdbc.password={self.cfg['password']}\n")
-                f.write(f"atscale.{cube_key}.jdbc.maxPoolSize=10\n")
-                f.write(f"atscale.{cube_key}.jdbc.log.resultset.rows=true\n")
-                
-                if jdbc_file:
-                    f.write(f"atscale.{cube_key}.jdbc.setIngestionFileName={jdbc_file}\n")
-                    f.write(f"atscale.{cube_key}.jdbc.setIngestionFileHasHeader={str(jdbc_has_header).lower()}\n")
-                
-                f.write(f"atscale.{cube_key}.xmla.auth.url=https://{self.cfg['host']}:10500/default/auth\n")
-                f.write(f"atscale.{cube_key}.xmla.url=https://{self.cfg['host']}:10502/xmla/default/{self.cfg['token']}\n")
-                f.write(f"atscale.{cube_key}.xmla.cube={cube}\n")
-                f.write(f"atscale.{cube_key}.xmla.catalog={catalog}\n")
-                f.write(f"atscale.{cube_key}.xmla.log.responsebody=true\n")
-                f.write(f"atscale.{cube_key}.xmla.auth.username={self.cfg['username']}\n")
-                f.write(f"atscale.{cube_key}.xmla.auth.password={self.cfg['password']}\n")
-                
-                if xmla_file:
-                    f.write(f"atscale.{cube_key}.xmla.setIngestionFileName={xmla_file}\n")
-                    f.write(f"atscale.{cube_key}.xmla.setIngestionFileHasHeader={str(xmla_has_header).lower()}\n")
-                
-                f.write("# \n")
-
-            f.write(f"atscale.postgres.jdbc.url=jdbc:postgresql://{self.cfg['postgres_host']}:10520/atscale\n")
-            f.write("atscale.postgres.jdbc.username=atscale\n")
-            f.write("atscale.postgres.jdbc.password=atscale\n")
-            f.write("#System Parameter\n")
-            f.write("atscale.gatling.throttle.ms=5\n")
-            f.write("atscale.xmla.maxConnectionsPerHost=20\n")
-            f.write("atscale.xmla.useAggregates=true\n")
-            f.write("atscale.xmla.generateAggregates=false\n")
-            f.write("atscale.xmla.useQueryCache=false\n")
-            f.write("atscale.xmla.useAggregateCache=true\n")
-            f.write("atscale.jdbc.useAggregates=true\n")
-            f.write("atscale.jdbc.generateAggregates=false\n")
-            f.write("atscale.jdbc.useLocalCache=false\n")
-            
-            # Add AWS config if present
-            if self.cfg.get("aws.region"):
-                f.write(f"aws.region={self.cfg['aws.region']}\n")
-            if self.cfg.get("aws.secrets-key"):
-                f.write(f"aws.secrets-key={self.cfg['aws.secrets-key']}\n")
-                
-            # Add Snowflake config if present
-            if self.cfg.get("snowflake.archive.account"):
-                f.write(f"snowflake.archive.account={self.cfg['snowflake.archive.account']}\n")
-            if self.cfg.get("snowflake.archive.warehouse"):
-                f.write(f"snowflake.archive.warehouse={self.cfg['snowflake.archive.warehouse']}\n")
-            if self.cfg.get("snowflake.archive.database"):
-                f.write(f"snowflake.archive.database={self.cfg['snowflake.archive.database']}\n")
-            if self.cfg.get("snowflake.archive.schema"):
-                f.write(f"snowflake.archive.schema={self.cfg['snowflake.archive.schema']}\n")
-            if self.cfg.get("snowflake.archive.role"):
-                f.write(f"snowflake.archive.role={self.cfg['snowflake.archive.role']}\n")
-            if self.cfg.get("snowflake.archive.username"):
-                f.write(f"snowflake.archive.username={self.cfg['snowflake.archive.username']}\n")
-            if self.cfg.get("snowflake.archive.password"):
-                f.write(f"snowflake.archive.password={self.cfg['snowflake.archive.token']}\n")
-            if self.cfg.get("snowflake.archive.token"):
-                f.write(f"snowflake.archive.token={self.cfg['snowflake.archive.token']}\n")
-            
-        print(f"✅ CSV systems.properties generated for {len(selected_pairs)} selected pairs")
\ No newline at end of file
+        self._write_systems_properties(
+            selected_pairs, file_assignments,
+            "# CSV Mode Configuration\natscale.schema.type=ingestion\n", _PAIR_TEMPLATE_CSV)
+        print(f"✅ CSV systems.properties generated for {len(selected_pairs)} selected pairs")
@@ -5,11 +5,11 @@ import threading
 import subprocess
 import os
 import time
-import queue
+from collections import deque
 from datetime import datetime
 from .core import AtScaleGatlingCore
 from .csv_handler import CSVConfigWindow
-from .config_manager import ConfigManager
+from .config_manager import get_config_manager
 
 class AtScaleGatlingGUI:
     def __init__(self, root):
@@ -18,8 +18,9 @@ class AtScaleGatlingGUI:
         self.root.geometry("1200x800")
         
         self.core = AtScaleGatlingCore()
-        self.config_manager = ConfigManager()  # Add this line
-        self.log_queue = queue.Queue()
+        self.config_manager = get_config_manager()
+        # Tail thread appends, Tk thread pops; deque ops are atomic and the cap bounds memory
+        self.log_queue = deque(maxlen=20000)
         self.tail_process = None
         self.current_executor = None
         self.is_running = False
@@ -815,11 +816,11 @@ class AtScaleGatlingGUI:
                 while self.tail_process and self.tail_process.poll() is None and self.is_running:
                     line = self.tail_process.stdout.readline()
                     if line:
-                        self.log_queue.put(line.strip())
+                        self.log_queue.append(line.strip())
                     time.sleep(0.01)
                         
             except Exception as e:
-                self.log_queue.put(f"Tail error: {e}")
+                self.log_queue.append(f"Tail error: {e}")
             finally:
                 if self.tail_process:
                     self.tail_process.terminate()
@@ -837,11 +838,8 @@ class AtScaleGatlingGUI:
         """Monitor log queue and update display"""
         def check_queue():
             try:
-                while True:
-                    line = self.log_queue.get_nowait()
-                    self.append_log(line)
-            except queue.Empty:
-                pass
+                while self.log_queue:
+                    self.append_log(self.log_queue.popleft())
             finally:
                 self.root.after(100, check_queue)
                 
@@ -24,11 +24,11 @@ def check_dependencies() -> bool:
         return False
 
 
-def ensure_config_exists(mode: str) -> bool:
+def ensure_config_exists(mode: str, accept_defaults: bool = False) -> bool:
     """Ensure config.json exists before proceeding."""
     try:
-        from atscalewrapper.config_manager import ConfigManager
-        config_manager = ConfigManager()
+        from atscalewrapper.config_manager import get_config_manager
+        config_manager = get_config_manager()
         
         if config_manager.config_exists():
             return True
@@ -96,7 +96,7 @@ def ensure_config_exists(mode: str) -> bool:
             return config_manager.create_config_gui()
         else:
             # CLI mode
-            return config_manager.create_config_cli()
+            return config_manager.create_config_cli(accept_defaults=accept_defaults)
             
     except Exception as e:
         print(f"❌ Configuration setup failed: {e}")
@@ -110,7 +110,7 @@ def setup_environment(args) -> bool:
     print("="*60)
     
     # 1. Ensure config exists FIRST
-    if not ensure_config_exists(args.mode):
+    if not ensure_config_exists(args.mode, accept_defaults=args.accept_defaults):
         return False
     
     print("✅ Configuration check passed")
@@ -138,8 +138,8 @@ def setup_environment(args) -> bool:
     
     # 4. Check certificates (just inform user)
     try:
-        from atscalewrapper.config_manager import ConfigManager
-        config_manager = ConfigManager()
+        from atscalewrapper.config_manager import get_config_manager
+        config_manager = get_config_manager()
         
         root_crt = os.path.join(config_manager.home_dir, 'root.crt')
         cacerts = os.path.join(config_manager.home_dir, 'cacerts')
@@ -197,6 +197,11 @@ def main() -> int:
         default="gui",
         help="Run in GUI or CLI mode (default: GUI)",
     )
+    parser.add_argument(
+        "--accept-defaults",
+        action="store_true",
+        help="When creating config.json in CLI mode, skip the optional-field prompt",
+    )
     
     args, remaining = parser.parse_known_args()
     